@@ -0,0 +1,161 @@
+"""
+Benchmark suite for update and render across all levels
+Runs headless with scripted input and writes machine-readable JSON.
+
+Usage:
+    python benchmark.py --frames 1200 --output benchmark_results.json
+"""
+import argparse
+import json
+import platform
+import time
+import pygame
+import config
+import debug_log
+import headless
+from frame_profiler import FrameProfiler, summarize
+
+
+NUM_LEVELS = 10
+
+# Per-system phases of GameScreen.update, in update order
+SYSTEM_PHASES = ["streaming", "activation", "input", "player", "enemies", "physics", "collision", "camera", "particles"]
+
+
+def benchmark_level_build(level_number, repeats):
+    """Measure how long it takes to build a level
+
+    Cold builds clear the level data cache first, so every one of them loads
+    (or generates) the LevelData; warm builds reuse the cached LevelData.
+
+    Returns:
+        (cold build statistics, warm build statistics)
+    """
+    from world.level import Level
+
+    cold_samples = []
+    warm_samples = []
+    for _ in range(repeats):
+        Level._level_data_cache.pop(level_number, None)
+        start = time.perf_counter()
+        Level(level_number)
+        cold_samples.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        Level(level_number)
+        warm_samples.append(time.perf_counter() - start)
+    return summarize(cold_samples), summarize(warm_samples)
+
+
+def benchmark_level(level_number, frames, warmup, delta, surface):
+    """Measure update and render cost on one level
+
+    Returns:
+        Dict with update/render statistics and per-system costs (ms)
+    """
+    screen = headless.create_game_screen(level_number)
+
+    # Warm up caches (baked chunks, particle sprites) before measuring
+    for _ in range(warmup):
+        screen.update(delta)
+        screen.render(surface)
+
+    profiler = FrameProfiler()
+    screen.profiler = profiler
+    update_samples = []
+    render_samples = []
+    culled_samples = []
+    active_enemy_samples = []
+
+    measured = 0
+    for _ in range(frames):
+        start = time.perf_counter()
+        screen.update(delta)
+        middle = time.perf_counter()
+        screen.render(surface)
+        end = time.perf_counter()
+
+        update_samples.append(middle - start)
+        render_samples.append(end - middle)
+        culled_samples.append(screen.get_culled_count())
+        active_enemy_samples.append(screen.get_active_enemy_count())
+        measured += 1
+
+        # Stop at the goal so every sample belongs to this level
+        if screen.level_complete:
+            break
+
+    screen.dispose()
+    phases = profiler.get_summary()
+
+    return {
+        "frames": measured,
+        "completed": screen.level_complete,
+        "update_ms": summarize(update_samples),
+        "render_ms": summarize(render_samples),
+        "systems_ms": {name: phases[name] for name in SYSTEM_PHASES if name in phases},
+        "render_phases_ms": {name: stats for name, stats in phases.items() if name.startswith("render_")},
+        "culled_per_frame": sum(culled_samples) / len(culled_samples) if culled_samples else 0.0,
+        "active_enemies_per_frame": (sum(active_enemy_samples) / len(active_enemy_samples)
+                                     if active_enemy_samples else 0.0),
+    }
+
+
+def run(frames, warmup, build_repeats, levels):
+    """Run the benchmark for the given levels"""
+    headless.init_headless()
+    offscreen = pygame.Surface((config.WINDOW_WIDTH, config.WINDOW_HEIGHT))
+    delta = config.FIXED_TIMESTEP
+
+    results = {
+        "meta": {
+            "frames": frames,
+            "warmup": warmup,
+            "build_repeats": build_repeats,
+            "delta": delta,
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "levels": {},
+    }
+
+    for level_number in levels:
+        build_cold, build_warm = benchmark_level_build(level_number, build_repeats)
+        level_result = {"build_cold_ms": build_cold, "build_warm_ms": build_warm}
+        level_result.update(benchmark_level(level_number, frames, warmup, delta, offscreen))
+        results["levels"][str(level_number)] = level_result
+
+        print(f"Level {level_number:2d}: build {build_cold['mean']:.2f} ms "
+              f"(cached {build_warm['mean']:.2f} ms), "
+              f"update p99 {level_result['update_ms']['p99']:.3f} ms, "
+              f"render p99 {level_result['render_ms']['p99']:.3f} ms")
+
+    return results
+
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark StoneRush update and render")
+    parser.add_argument("--frames", type=int, default=1200, help="Measured frames per level")
+    parser.add_argument("--warmup", type=int, default=60, help="Unmeasured frames before measuring")
+    parser.add_argument("--build-repeats", type=int, default=5, help="Level builds to time per level")
+    parser.add_argument("--levels", type=int, nargs="+", default=list(range(1, NUM_LEVELS + 1)),
+                        help="Levels to benchmark (default: all)")
+    parser.add_argument("--output", default="benchmark_results.json", help="JSON output path")
+    parser.add_argument("--log", default=None, help="Diagnostic log categories (see debug_log)")
+    args = parser.parse_args()
+    try:
+        debug_log.configure(args.log)
+    except ValueError as e:
+        parser.error(str(e))
+
+    results = run(args.frames, args.warmup, args.build_repeats, args.levels)
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Texture atlas build step
+Packs all game sprites, pre-scaled to their in-game sizes, into one atlas
+image plus a JSON manifest, which SpriteManager loads at startup.
+
+Run it again whenever a sprite PNG or a sprite size in config changes.
+
+Usage:
+    python build_atlas.py                    # assets/atlas.png + assets/atlas.json
+    python build_atlas.py --padding 2
+"""
+import argparse
+import json
+import os
+import pygame
+from sprite_manager import ASSETS_DIR, ATLAS_IMAGE, ATLAS_MANIFEST, SPRITES
+
+
+ATLAS_VERSION = 1
+
+
+def load_scaled_sprites(assets_dir):
+    """Load every sprite in SPRITES and scale it to its in-game size
+
+    Scaling uses pygame.transform.scale, like the game did at runtime, so
+    the atlas sprites are pixel-identical to the old runtime-scaled ones.
+
+    Returns:
+        Dict of name -> surface
+    """
+    sprites = {}
+    for name, (filename, size, _opaque) in SPRITES.items():
+        image = pygame.image.load(os.path.join(assets_dir, filename))
+        if image.get_size() != size:
+            image = pygame.transform.scale(image, size)
+        sprites[name] = image
+    return sprites
+
+
+def pack(sizes, padding):
+    """Place rectangles on shelves (rows), tallest first
+
+    The atlas is as wide as the widest rectangle; each shelf is filled left
+    to right until the next rectangle does not fit.
+
+    Args:
+        sizes: Dict of name -> (width, height)
+        padding: Empty pixels between rectangles
+
+    Returns:
+        (atlas size, dict of name -> (x, y, width, height))
+    """
+    atlas_width = max(width for width, _ in sizes.values())
+    order = sorted(sizes, key=lambda name: (-sizes[name][1], name))
+
+    rects = {}
+    x = y = shelf_height = 0
+    for name in order:
+        width, height = sizes[name]
+        if x and x + width > atlas_width:
+            # Start a new shelf
+            y += shelf_height + padding
+            x = shelf_height = 0
+        rects[name] = (x, y, width, height)
+        x += width + padding
+        shelf_height = max(shelf_height, height)
+    return (atlas_width, y + shelf_height), rects
+
+
+def build_atlas(assets_dir, image_path, manifest_path, padding):
+    """Build the atlas image and manifest
+
+    Returns:
+        Atlas size (width, height)
+    """
+    sprites = load_scaled_sprites(assets_dir)
+    size, rects = pack({name: sprite.get_size() for name, sprite in sprites.items()}, padding)
+
+    atlas = pygame.Surface(size, pygame.SRCALPHA)
+    for name, sprite in sprites.items():
+        atlas.blit(sprite, rects[name][:2])
+    pygame.image.save(atlas, image_path)
+
+    manifest = {
+        "version": ATLAS_VERSION,
+        "image": os.path.basename(image_path),
+        "size": list(size),
+        "sprites": {
+            name: {
+                "rect": list(rects[name]),
+                "source": SPRITES[name][0],
+                "opaque": SPRITES[name][2],
+            }
+            for name in SPRITES
+        },
+    }
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+        f.write("\n")
+    return size
+
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Build the StoneRush sprite atlas")
+    parser.add_argument("--assets-dir", default=ASSETS_DIR, help="Directory with the sprite PNGs")
+    parser.add_argument("--image", default=ATLAS_IMAGE, help="Atlas image output path")
+    parser.add_argument("--manifest", default=ATLAS_MANIFEST, help="Atlas manifest output path")
+    parser.add_argument("--padding", type=int, default=1, help="Empty pixels between sprites")
+    args = parser.parse_args()
+
+    width, height = build_atlas(args.assets_dir, args.image, args.manifest, args.padding)
+    print(f"Atlas {width}x{height} with {len(SPRITES)} sprites: {args.image}, {args.manifest}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@
 Game constants and configuration
 Ported from Constants.java
 """
+import os
 
 # Window settings
 WINDOW_WIDTH = 800
@@ -9,6 +10,18 @@ WINDOW_HEIGHT = 600
 GAME_TITLE = "StoneRush"
 TARGET_FPS = 60
 
+# Simulation settings
+USE_FIXED_TIMESTEP = True  # Simulate in fixed steps, render with interpolation
+SIMULATION_HZ = 120
+FIXED_TIMESTEP = 1.0 / SIMULATION_HZ
+MAX_SIMULATION_STEPS = 8  # Catch-up limit per rendered frame (prevents spiral of death)
+
+# Audio settings
+MUSIC_PATH = os.path.join(os.path.dirname(__file__), "import", "ovrworld.wav")
+
+# Level files (level_01.srl ...); levels without a file are generated
+LEVELS_DIR = os.path.join(os.path.dirname(__file__), "levels")
+
 # World settings
 GRAVITY = 800.0  # Positive in Pygame (y increases downward)
 PIXELS_PER_METER = 32.0
@@ -25,14 +38,21 @@ PLAYER_MAX_LIVES = 3
 ENEMY_SIZE = 32.0  # Smaller sprites (32x32 pixels)
 ENEMY_SPEED = 50.0
 ENEMY_PATROL_DISTANCE = 128.0
+ENEMY_ACTIVATION_MARGIN = 256.0  # Enemies this far outside the view stay awake
 
 # Block settings
 BLOCK_SIZE = 32.0
 
-# Level settings
+# Level settings (size of generated levels; loaded levels bring their own)
 LEVEL_WIDTH_BLOCKS = 100
 LEVEL_HEIGHT_BLOCKS = 20
 
+# Chunk streaming: only chunks near the view are live. The load margin must
+# cover ENEMY_ACTIVATION_MARGIN, so awake enemies always stand on loaded tiles
+CHUNK_WIDTH_BLOCKS = 16
+CHUNK_LOAD_MARGIN = 512.0  # Load chunks this far (px) ahead of the view
+CHUNK_EVICT_MARGIN = 1024.0  # Evict chunks once they are this far (px) from the view
+
 # Colors (RGB format, 0-255)
 # Converted from LibGDX Color (0.0-1.0) by multiplying by 255
 COLOR_PLAYER = (128, 128, 128)  # Gray
@@ -0,0 +1,78 @@
+"""
+Diagnostic logging by category
+Verbose output is off by default (warnings only). Enable categories with the
+STONERUSH_LOG environment variable or the --log command line flag:
+
+    STONERUSH_LOG=collision,state          # debug output for two categories
+    STONERUSH_LOG=all=info,collision=debug # info everywhere, debug for collision
+
+Messages use logging's lazy %-style arguments, so a disabled message is
+never formatted.
+"""
+import logging
+import os
+
+
+CATEGORIES = ("collision", "animation", "state", "sprites", "assets")
+ENV_VAR = "STONERUSH_LOG"
+DEFAULT_LEVEL = logging.WARNING
+
+_ROOT_NAME = "stonerush"
+_loggers = {name: logging.getLogger(f"{_ROOT_NAME}.{name}") for name in CATEGORIES}
+for _logger in _loggers.values():
+    _logger.setLevel(DEFAULT_LEVEL)
+
+
+def get_logger(category):
+    """Get the logger for a category (one of CATEGORIES)"""
+    return _loggers[category]
+
+
+def parse_spec(spec):
+    """Parse a category spec like "all=info,collision=debug"
+
+    Returns:
+        Dict of category name -> logging level
+    """
+    levels = {}
+    for entry in spec.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+
+        name, _, level_name = entry.partition("=")
+        name = name.strip().lower()
+        level = logging.getLevelName(level_name.strip().upper() or "DEBUG")
+        if not isinstance(level, int):
+            raise ValueError(f"Unknown log level in '{entry}'")
+
+        if name == "all":
+            for category in CATEGORIES:
+                levels[category] = level
+        elif name in _loggers:
+            levels[name] = level
+        else:
+            raise ValueError(f"Unknown log category '{name}' (expected one of {', '.join(CATEGORIES)})")
+    return levels
+
+
+def configure(spec=None):
+    """Set category levels and install the console handler
+
+    Args:
+        spec: Category spec (see parse_spec); defaults to $STONERUSH_LOG
+    """
+    if spec is None:
+        spec = os.environ.get(ENV_VAR, "")
+
+    root = logging.getLogger(_ROOT_NAME)
+    if not root.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("[%(levelname)s] %(name)s: %(message)s"))
+        root.addHandler(handler)
+        root.propagate = False
+
+    for logger in _loggers.values():
+        logger.setLevel(DEFAULT_LEVEL)
+    for category, level in parse_spec(spec).items():
+        _loggers[category].setLevel(level)
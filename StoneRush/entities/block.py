@@ -3,93 +3,107 @@ Block entity
 Ported from Block.java
 """
 import pygame
-from entities.game_object import GameObject
 from enums import BlockType
 from sprite_manager import SpriteManager
+from debug_log import get_logger
 import config
 
 
-class Block(GameObject):
-    """Represents a platform block in the level"""
-
-    # Class-level sprite manager and sprites (shared by all blocks)
-    _sprite_manager = None
-    _sprite_ground = None
-    _sprite_cracked = None
-
-    @classmethod
-    def _load_sprites(cls):
-        """Load sprites once for all blocks"""
-        if cls._sprite_manager is None:
-            print("[BLOCK] Lade Block-Sprites vom SpriteManager...")
-            cls._sprite_manager = SpriteManager()
-            cls._sprite_ground = cls._sprite_manager.get_sprite("block_ground")
-            cls._sprite_cracked = cls._sprite_manager.get_sprite("block_cracked")
-
-            # Scale to block size
-            target_size = (int(config.BLOCK_SIZE), int(config.BLOCK_SIZE))
-            if cls._sprite_ground:
-                print(f"[BLOCK] Ground-Sprite gefunden, skaliere auf {target_size}")
-                cls._sprite_ground = pygame.transform.scale(cls._sprite_ground, target_size)
-            else:
-                print("[WARNUNG] Ground-Sprite NICHT gefunden!")
-
-            if cls._sprite_cracked:
-                print(f"[BLOCK] Cracked-Sprite gefunden, skaliere auf {target_size}")
-                cls._sprite_cracked = pygame.transform.scale(cls._sprite_cracked, target_size)
-            else:
-                print("[WARNUNG] Cracked-Sprite NICHT gefunden!")
+log = get_logger("assets")
 
-    def __init__(self, x, y, block_type):
-        super().__init__(x, y, config.BLOCK_SIZE, config.BLOCK_SIZE)
+
+class TileType:
+    """Shared sprite and behaviour of one kind of tile (flyweight)
+
+    Terrain is stored as tile codes in the level grid. Everything the tiles
+    of one BlockType have in common lives in a single TileType instance
+    (see TILE_TYPES), instead of in one object per tile.
+    """
+
+    def __init__(self, block_type, sprite_name, color, solid, destructible):
         self.block_type = block_type
-        self.is_destroyed = False
+        self.sprite_name = sprite_name
+        self.color = color  # Fallback if the sprite is missing
+        self.solid = solid
+        self.destructible = destructible  # Can be destroyed by ramming
+        self.sprite = None
+        self._sprite_loaded = False
+
+    def get_sprite(self):
+        """Get the block-sized sprite (looked up once, None if missing)"""
+        if not self._sprite_loaded:
+            self._sprite_loaded = True
+            if self.sprite_name is None:
+                return None
+            self.sprite = SpriteManager().get_sprite(self.sprite_name)
+            if not self.sprite:
+                log.warning("%s NICHT gefunden!", self.sprite_name)
+        return self.sprite
+
+    def render(self, surface, x, y):
+        """Draw one tile of this type at screen position (x, y)"""
+        if not self.solid:
+            return
+
+        # Draw sprite if available
+        sprite = self.get_sprite()
+        if sprite:
+            surface.blit(sprite, (int(x), int(y)))
+            return
 
-        # Load sprites on first block creation
-        Block._load_sprites()
+        # Fallback to colored rectangles if sprites not loaded
+        pygame.draw.rect(surface, self.color, (x, y, config.BLOCK_SIZE, config.BLOCK_SIZE))
 
-    def is_solid(self):
-        """Returns True if the block is solid (not destroyed)"""
-        return not self.is_destroyed
+        # Draw border for destructible (cracked) blocks
+        if self.destructible:
+            pygame.draw.rect(surface, config.COLOR_BLACK,
+                           (x, y, config.BLOCK_SIZE, config.BLOCK_SIZE), 2)
+
+
+# One flyweight per block type
+TILE_TYPES = {
+    BlockType.EMPTY: TileType(BlockType.EMPTY, None, None, solid=False, destructible=False),
+    BlockType.GROUND: TileType(BlockType.GROUND, "block_ground", config.COLOR_GROUND,
+                               solid=True, destructible=False),
+    BlockType.CRACKED: TileType(BlockType.CRACKED, "block_cracked", config.COLOR_CRACKED_BLOCK,
+                                solid=True, destructible=True),
+}
+
+
+class Block:
+    """Represents a platform block in the level
 
-    def destroy(self):
-        """Mark block as destroyed"""
-        self.is_destroyed = True
+    A read-only view of one solid tile, only created when code needs an
+    object (e.g. Level.get_blocks_in_range()); the level itself just stores
+    tile codes. Sprite and behaviour come from the shared TileType. Tiles
+    are destroyed in the level (Level.destroy_tile()), not through a view.
+    """
+
+    __slots__ = ("position", "width", "height", "bounds", "block_type", "tile_type")
+
+    def __init__(self, x, y, block_type):
+        self.position = pygame.Vector2(x, y)
+        self.width = config.BLOCK_SIZE
+        self.height = config.BLOCK_SIZE
+        self.bounds = pygame.Rect(x, y, self.width, self.height)
+        self.block_type = block_type
+        self.tile_type = TILE_TYPES[block_type]
+
+    def is_solid(self):
+        """Returns True if the block's tile type is solid"""
+        return self.tile_type.solid
 
     def get_type(self):
         return self.block_type
 
+    def get_position(self):
+        return self.position
+
+    def get_bounds(self):
+        return self.bounds
+
     def render(self, surface, camera_offset):
         """Render the block"""
-        if self.is_destroyed:
-            return
-
         # Calculate screen position with camera offset
-        screen_x = self.position.x - camera_offset[0]
-        screen_y = self.position.y - camera_offset[1]
-
-        # Choose sprite based on block type
-        sprite = None
-        if self.block_type == BlockType.GROUND:
-            sprite = Block._sprite_ground
-        elif self.block_type == BlockType.CRACKED:
-            sprite = Block._sprite_cracked
-
-        # Draw sprite if available
-        if sprite:
-            surface.blit(sprite, (int(screen_x), int(screen_y)))
-        else:
-            # Fallback to colored rectangles if sprites not loaded
-            if self.block_type == BlockType.GROUND:
-                color = config.COLOR_GROUND
-            elif self.block_type == BlockType.CRACKED:
-                color = config.COLOR_CRACKED_BLOCK
-            else:
-                return
-
-            pygame.draw.rect(surface, color, (screen_x, screen_y, self.width, self.height))
-
-            # Draw border for cracked blocks
-            if self.block_type == BlockType.CRACKED:
-                pygame.draw.rect(surface, config.COLOR_BLACK,
-                               (screen_x, screen_y, self.width, self.height), 2)
+        self.tile_type.render(surface, self.position.x - camera_offset[0],
+                              self.position.y - camera_offset[1])
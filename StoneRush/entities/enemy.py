@@ -3,52 +3,60 @@ Enemy entity
 Ported from Enemy.java
 """
 import pygame
-from entities.game_object import GameObject
-from enums import Direction
 import config
 
 
-class Enemy(GameObject):
-    """Enemy that patrols back and forth"""
+class Enemy:
+    """Enemy that patrols back and forth
 
-    def __init__(self, x, y):
-        super().__init__(x, y, config.ENEMY_SIZE, config.ENEMY_SIZE)
-        self.start_x = x
-        self.patrol_direction = Direction.RIGHT
-        self.velocity.x = config.ENEMY_SPEED
-        self.is_dead = False
+    A lightweight view of one enemy in an EnemyManager. The state lives in
+    the manager's arrays (the whole level is simulated in one batch); the
+    view reads it for rendering and for the player-vs-enemy checks.
+    Position, velocity and bounds are returned as copies.
+    """
 
-    def update(self, delta):
-        """Update enemy position and patrol logic"""
-        if self.is_dead:
-            return
+    width = config.ENEMY_SIZE
+    height = config.ENEMY_SIZE
+
+    __slots__ = ("manager", "index")
+
+    def __init__(self, manager, index):
+        self.manager = manager
+        self.index = index
 
-        # Check if reached patrol boundary
-        if abs(self.position.x - self.start_x) >= config.ENEMY_PATROL_DISTANCE:
-            # Turn around
-            if self.patrol_direction == Direction.RIGHT:
-                self.patrol_direction = Direction.LEFT
-            else:
-                self.patrol_direction = Direction.RIGHT
+    @property
+    def position(self):
+        return pygame.Vector2(self.manager.x[self.index], self.manager.y[self.index])
 
-            self.velocity.x = self.patrol_direction.get_value() * config.ENEMY_SPEED
+    @property
+    def velocity(self):
+        return pygame.Vector2(self.manager.vx[self.index], self.manager.vy[self.index])
 
-        super().update(delta)
+    @property
+    def bounds(self):
+        # Assigned rather than passed to the constructor: assignment rounds
+        # (like GameObject.update_bounds()), the constructor truncates
+        rect = pygame.Rect(0, 0, self.width, self.height)
+        rect.x = self.manager.x[self.index]
+        rect.y = self.manager.y[self.index]
+        return rect
+
+    @property
+    def is_dead(self):
+        return not self.manager.alive[self.index]
 
     def die(self):
         """Kill the enemy"""
-        self.is_dead = True
-        self.velocity.x = 0
-        self.velocity.y = 0
+        self.manager.kill(self.index)
 
     def render(self, surface, camera_offset):
-        """Render the enemy"""
+        """Render the enemy at its interpolated position"""
         if self.is_dead:
             return
 
         # Calculate screen position with camera offset
-        screen_x = self.position.x - camera_offset[0]
-        screen_y = self.position.y - camera_offset[1]
+        screen_x = self.manager.render_x[self.index] - camera_offset[0]
+        screen_y = self.manager.render_y[self.index] - camera_offset[1]
 
         # Draw red square body
         pygame.draw.rect(surface, config.COLOR_ENEMY,
@@ -60,3 +68,12 @@ class Enemy(GameObject):
                          (int(screen_x + 8), int(screen_y + 20)), eye_radius)
         pygame.draw.circle(surface, config.COLOR_BLACK,
                          (int(screen_x + 24), int(screen_y + 20)), eye_radius)
+
+    def get_position(self):
+        return self.position
+
+    def get_velocity(self):
+        return self.velocity
+
+    def get_bounds(self):
+        return self.bounds
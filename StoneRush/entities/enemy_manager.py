@@ -0,0 +1,155 @@
+"""
+Enemy manager
+Simulates all enemies of a level in one batch
+"""
+import numpy as np
+from entities.enemy import Enemy
+import config
+
+
+def round_like_rect(values):
+    """Round pixel positions to ints the way pygame.Rect does (half away from zero)"""
+    return np.trunc(values + np.copysign(0.5, values))
+
+
+class EnemyManager:
+    """Stores the enemies of a level as a struct of NumPy arrays
+
+    One array per attribute (position, velocity, patrol origin and
+    direction), indexed in spawn order. Patrol turnaround, movement and
+    render interpolation run as vectorized operations; PhysicsSystem and
+    CollisionSystem apply gravity and tile collisions to the same arrays.
+    The Enemy objects in `enemies` are views into these arrays.
+
+    Only active enemies (alive and near the camera) are simulated. The
+    others sleep: their whole state is frozen until they come back into
+    the activation region, where they continue exactly where they stopped.
+    """
+
+    WIDTH = config.ENEMY_SIZE
+    HEIGHT = config.ENEMY_SIZE
+
+    def __init__(self, spawn_positions):
+        """Create the enemies
+
+        Args:
+            spawn_positions: List of (x, y) spawn positions in pixels (Pygame coordinates)
+        """
+        spawns = np.array(spawn_positions, dtype=np.float64).reshape(-1, 2)
+        self.count = len(spawns)
+        self.spawn_x = spawns[:, 0].copy()
+        self.spawn_y = spawns[:, 1].copy()
+
+        count = self.count
+        self.x = np.zeros(count)
+        self.y = np.zeros(count)
+        self.vx = np.zeros(count)
+        self.vy = np.zeros(count)
+        self.start_x = np.zeros(count)  # Patrol origin
+        self.direction = np.zeros(count)  # Patrol direction: 1 = right, -1 = left
+        self.alive = np.zeros(count, dtype=bool)
+        self.active = np.zeros(count, dtype=bool)  # Alive and awake (simulated this step)
+
+        # Render interpolation between simulation steps
+        self.previous_x = np.zeros(count)
+        self.previous_y = np.zeros(count)
+        self.render_x = np.zeros(count)
+        self.render_y = np.zeros(count)
+
+        self.enemies = [Enemy(self, i) for i in range(count)]
+        self.reset()
+
+    def reset(self):
+        """Revive every enemy at its spawn point (used on respawn)"""
+        self.x[:] = self.spawn_x
+        self.y[:] = self.spawn_y
+        self.vx[:] = config.ENEMY_SPEED
+        self.vy[:] = 0.0
+        self.start_x[:] = self.spawn_x
+        self.direction[:] = 1.0
+        self.alive[:] = True
+        self.active[:] = True
+
+        self.previous_x[:] = self.x
+        self.previous_y[:] = self.y
+        self.render_x[:] = self.x
+        self.render_y[:] = self.y
+
+    def save_previous_positions(self):
+        """Remember the positions at the start of a simulation step"""
+        self.previous_x[:] = self.x
+        self.previous_y[:] = self.y
+
+    def update_activation(self, view_position, margin):
+        """Wake the enemies near the view and put the others to sleep
+
+        Call once at the start of a step, so update, physics and collision
+        all see the same active set. The result only depends on the view
+        and the enemy positions, which keeps waking deterministic.
+
+        Args:
+            view_position: Top-left corner of the view (Camera.position)
+            margin: Pixels around the view in which enemies stay awake
+        """
+        left = view_position.x - margin
+        top = view_position.y - margin
+        right = view_position.x + config.WINDOW_WIDTH + margin
+        bottom = view_position.y + config.WINDOW_HEIGHT + margin
+        x = self.x
+        y = self.y
+        np.logical_and(self.alive, x + self.WIDTH > left, out=self.active)
+        self.active &= x < right
+        self.active &= y + self.HEIGHT > top
+        self.active &= y < bottom
+
+    def update(self, delta):
+        """Patrol turnaround and movement for all active enemies"""
+        active = self.active
+
+        # Turn around at the patrol boundary
+        turn = active & (np.abs(self.x - self.start_x) >= config.ENEMY_PATROL_DISTANCE)
+        if turn.any():
+            self.direction[turn] = -self.direction[turn]
+            self.vx[turn] = self.direction[turn] * config.ENEMY_SPEED
+
+        # Sleeping enemies keep their velocity for when they wake up
+        self.x[active] += self.vx[active] * delta
+        self.y[active] += self.vy[active] * delta
+
+    def interpolate(self, alpha):
+        """Set the render positions between the previous and the current step
+
+        Args:
+            alpha: 0.0 = previous step, 1.0 = current step
+        """
+        np.subtract(self.x, self.previous_x, out=self.render_x)
+        self.render_x *= alpha
+        self.render_x += self.previous_x
+        np.subtract(self.y, self.previous_y, out=self.render_y)
+        self.render_y *= alpha
+        self.render_y += self.previous_y
+
+    def kill(self, index):
+        """Kill one enemy"""
+        self.alive[index] = False
+        self.active[index] = False
+        self.vx[index] = 0.0
+        self.vy[index] = 0.0
+
+    def get_bounds_arrays(self):
+        """Get the integer bounds of all enemies, as pygame.Rect would store them
+
+        Returns:
+            Tuple (left, top) of float arrays holding whole pixel values
+        """
+        return round_like_rect(self.x), round_like_rect(self.y)
+
+    def get_living_indices(self):
+        return np.flatnonzero(self.alive)
+
+    def get_active_indices(self):
+        return np.flatnonzero(self.active)
+
+    def get_active_count(self):
+        """Get the number of enemies simulated in the current step"""
+        return int(np.count_nonzero(self.active))
@@ -7,7 +7,14 @@ from abc import ABC, abstractmethod
 
 
 class GameObject(ABC):
-    """Abstract base class for all game entities"""
+    """Abstract base class for all game entities
+
+    Entities use __slots__ (here and in every subclass), so instances carry
+    no per-instance dict: less memory and faster attribute access.
+    """
+
+    __slots__ = ("position", "velocity", "width", "height", "bounds",
+                 "previous_position", "render_position")
 
     def __init__(self, x, y, width, height):
         self.position = pygame.Vector2(x, y)
@@ -16,6 +23,10 @@ class GameObject(ABC):
         self.height = height
         self.bounds = pygame.Rect(x, y, width, height)
 
+        # Render interpolation between simulation steps
+        self.previous_position = pygame.Vector2(x, y)
+        self.render_position = pygame.Vector2(x, y)
+
     def update(self, delta):
         """Update position based on velocity"""
         self.position.x += self.velocity.x * delta
@@ -27,6 +38,30 @@ class GameObject(ABC):
         self.bounds.x = self.position.x
         self.bounds.y = self.position.y
 
+    def reset_position(self, x, y):
+        """Place the object at (x, y) at rest, without interpolating from the old position"""
+        self.position.update(x, y)
+        self.velocity.update(0, 0)
+        self.previous_position.update(x, y)
+        self.render_position.update(x, y)
+        self.update_bounds()
+
+    def save_previous_position(self):
+        """Remember the position at the start of a simulation step"""
+        self.previous_position.update(self.position)
+
+    def interpolate(self, alpha):
+        """Set render_position between the previous and the current position
+
+        Args:
+            alpha: 0.0 = previous step, 1.0 = current step
+        """
+        previous = self.previous_position
+        self.render_position.update(
+            previous.x + (self.position.x - previous.x) * alpha,
+            previous.y + (self.position.y - previous.y) * alpha
+        )
+
     @abstractmethod
     def render(self, surface, camera_offset):
         """Render the entity to the screen
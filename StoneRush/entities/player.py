@@ -2,19 +2,29 @@
 Player entity
 Ported from Player.java
 """
+import logging
 import pygame
 import math
 from entities.game_object import GameObject
 from enums import PlayerState, Direction
 from sprite_manager import SpriteManager
+from debug_log import get_logger
 import config
 
 
+log_animation = get_logger("animation")
+log_state = get_logger("state")
+log_sprites = get_logger("sprites")
+log_assets = get_logger("assets")
+
+
 class AnimationController:
     """Animation controller for sprite-based walk animation"""
 
     ANIMATION_SPEED = 6.0  # Animation speed (higher = faster)
 
+    __slots__ = ("walk_timer", "current_frame")
+
     def __init__(self):
         self.walk_timer = 0.0
         self.current_frame = 0  # 0 = idle frame, 1 = walk frame
@@ -26,15 +36,20 @@ class AnimationController:
             # Toggle between frame 0 and 1 every 1.0 units
             old_frame = self.current_frame
             self.current_frame = int(self.walk_timer) % 2
-            # Print when frame changes
+            # Log when frame changes
             if old_frame != self.current_frame:
-                print(f"Animation Frame: {self.current_frame}")
+                log_animation.debug("Animation Frame: %d", self.current_frame)
         else:
             # Reset to idle frame when not walking
             self.walk_timer = 0.0
             if self.current_frame != 0:
                 self.current_frame = 0
-                print(f"Animation Frame: {self.current_frame} (stopped)")
+                log_animation.debug("Animation Frame: %d (stopped)", self.current_frame)
+
+    def reset(self):
+        """Return to the idle frame"""
+        self.walk_timer = 0.0
+        self.current_frame = 0
 
     def get_current_frame(self):
         """Get current animation frame (0 or 1)"""
@@ -45,10 +60,30 @@ class AnimationController:
         return self.current_frame == 1
 
 
+class PlayerDebugInfo:
+    """Debug-only player state, kept out of Player's layout
+
+    Only created while sprite logging is enabled.
+    """
+
+    __slots__ = ("last_sprite_shown",)
+
+    def __init__(self):
+        self.last_sprite_shown = None  # Track last sprite shown
+
+
 class Player(GameObject):
     """Player character with states, lives, and ramming ability"""
 
     INVULNERABILITY_DURATION = 1.5
+    FLASH_COLOR = (255, 255, 255, 100)  # Added to the sprite while flashing
+
+    __slots__ = ("state", "facing_direction", "lives", "is_grounded", "ram_timer",
+                 "is_invulnerable", "invulnerability_timer", "animation_controller",
+                 "particle_system", "ram_particle_timer", "ram_blocked",
+                 "dash_energy", "max_dash_energy", "dash_drain_rate", "dash_regen_rate",
+                 "sprite_manager", "sprite_idle", "sprite_walk", "sprite_variants",
+                 "debug_info")
 
     def __init__(self, x, y):
         super().__init__(x, y, config.PLAYER_SIZE, config.PLAYER_SIZE)
@@ -62,8 +97,7 @@ class Player(GameObject):
         self.animation_controller = AnimationController()
         self.particle_system = None  # Will be set by game screen
         self.ram_particle_timer = 0  # Timer for spawning particles while ramming
-        self.debug_frame_counter = 0  # Debug: Count frames for less verbose output
-        self.last_sprite_shown = None  # Debug: Track last sprite shown
+        self.debug_info = None  # PlayerDebugInfo, only while debug logging is on
         self.ram_blocked = False  # Prevent dash from restarting immediately after collision
 
         # Dash energy system
@@ -72,41 +106,50 @@ class Player(GameObject):
         self.dash_drain_rate = 50.0  # Drains 50 energy per second while dashing
         self.dash_regen_rate = 33.33  # Regenerates 100 energy in 3 seconds (100/3)
 
-        # Load sprites
+        # Load sprites (already player-sized, see SpriteManager)
         self.sprite_manager = SpriteManager()
         self.sprite_idle = self.sprite_manager.get_sprite("player_idle")
         self.sprite_walk = self.sprite_manager.get_sprite("player_walk")
-
-        # Target size for both sprites (must be exactly the same)
-        target_size = (int(config.PLAYER_SIZE), int(config.PLAYER_SIZE))
-
-        # Scale sprites to match player size
-        if self.sprite_idle:
-            original_size = self.sprite_idle.get_size()
-            print(f"player_idle.png original size: {original_size}")
-            self.sprite_idle = pygame.transform.scale(self.sprite_idle, target_size)
-            final_size = self.sprite_idle.get_size()
-            print(f"[OK] player_idle.png scaled to: {final_size}")
-        else:
-            print("[ERROR] player_idle.png NOT loaded!")
-
-        if self.sprite_walk:
-            original_size = self.sprite_walk.get_size()
-            print(f"player_walk.png original size: {original_size}")
-            self.sprite_walk = pygame.transform.scale(self.sprite_walk, target_size)
-            final_size = self.sprite_walk.get_size()
-            print(f"[OK] player_walk.png scaled to: {final_size}")
-        else:
-            print("[ERROR] player_walk.png NOT loaded!")
+        if not self.sprite_idle:
+            log_assets.error("player_idle NOT loaded!")
+        if not self.sprite_walk:
+            log_assets.error("player_walk NOT loaded!")
 
         # Verify both sprites are exactly the same size
         if self.sprite_idle and self.sprite_walk:
             if self.sprite_idle.get_size() == self.sprite_walk.get_size():
-                print(f"[OK] Both sprites are the same size: {target_size}")
+                log_assets.debug("Both sprites are the same size: %s", self.sprite_idle.get_size())
             else:
-                print(f"[WARNING] Sprite sizes don't match!")
-                print(f"  idle: {self.sprite_idle.get_size()}")
-                print(f"  walk: {self.sprite_walk.get_size()}")
+                log_assets.warning("Sprite sizes don't match! idle: %s, walk: %s",
+                                   self.sprite_idle.get_size(), self.sprite_walk.get_size())
+
+        # Precompute every frame/facing/flash combination (shared via SpriteManager)
+        # so rendering only has to pick one: (frame name, facing left, flashing) -> surface
+        self.sprite_variants = {}
+        if self.sprite_idle and self.sprite_walk:
+            for frame_name in ("idle", "walk"):
+                for facing_left in (False, True):
+                    for flashing in (False, True):
+                        self.sprite_variants[(frame_name, facing_left, flashing)] = \
+                            self.sprite_manager.get_sprite_variant(
+                                f"player_{frame_name}", None, facing_left,
+                                self.FLASH_COLOR if flashing else None
+                            )
+
+    def reset(self, x, y):
+        """Reset the player to its spawn state at (x, y) (used on respawn)"""
+        self.reset_position(x, y)
+        self.state = PlayerState.IDLE
+        self.facing_direction = Direction.RIGHT
+        self.lives = config.PLAYER_MAX_LIVES
+        self.is_grounded = False
+        self.ram_timer = 0
+        self.is_invulnerable = False
+        self.invulnerability_timer = 0
+        self.animation_controller.reset()
+        self.ram_particle_timer = 0
+        self.ram_blocked = False
+        self.dash_energy = self.max_dash_energy
 
     def update(self, delta):
         """Update player state and timers"""
@@ -169,9 +212,9 @@ class Player(GameObject):
         else:
             self.state = PlayerState.IDLE
 
-        # Debug: Print when state changes
+        # Debug: Log when state changes
         if old_state != self.state:
-            print(f"State changed: {old_state.name} -> {self.state.name}")
+            log_state.debug("State changed: %s -> %s", old_state.name, self.state.name)
 
     def move_left(self):
         """Move player left"""
@@ -268,39 +311,27 @@ class Player(GameObject):
     def render(self, surface, camera_offset):
         """Render the player with sprites"""
         # Calculate screen position with camera offset
-        screen_x = self.position.x - camera_offset[0]
-        screen_y = self.position.y - camera_offset[1]
+        screen_x = self.render_position.x - camera_offset[0]
+        screen_y = self.render_position.y - camera_offset[1]
 
         # Choose sprite based on state and animation frame
-        sprite_name = ""
-        if self.state == PlayerState.WALKING:
-            # Alternate between idle and walk sprite when walking
-            if self.animation_controller.is_walking_frame():
-                current_sprite = self.sprite_walk.copy()
-                sprite_name = "walk"
-            else:
-                current_sprite = self.sprite_idle.copy()
-                sprite_name = "idle"
+        # Alternate between idle and walk sprite when walking, use idle sprite
+        # for all other states (idle, jumping, falling, ramming)
+        if self.state == PlayerState.WALKING and self.animation_controller.is_walking_frame():
+            sprite_name = "walk"
         else:
-            # Use idle sprite for all non-walking states (idle, jumping, falling, ramming)
-            current_sprite = self.sprite_idle.copy()
             sprite_name = "idle"
 
-        # Debug: Print when sprite changes
-        if sprite_name != self.last_sprite_shown:
-            print(f"Showing: {sprite_name} sprite (state: {self.state.name})")
-            self.last_sprite_shown = sprite_name
+        # Debug: Log when sprite changes
+        if log_sprites.isEnabledFor(logging.DEBUG):
+            self._log_sprite_change(sprite_name)
 
-        if current_sprite:
-            # Flip sprite if facing left
-            if self.facing_direction == Direction.LEFT:
-                current_sprite = pygame.transform.flip(current_sprite, True, False)
-
-            # Apply flashing effect if invulnerable
-            if self.is_invulnerable and int(self.invulnerability_timer * 10) % 2 == 0:
-                # Create white tinted version for flash effect
-                current_sprite.fill((255, 255, 255, 100), special_flags=pygame.BLEND_RGBA_ADD)
+        # Flip sprite if facing left, flash white while invulnerable
+        facing_left = self.facing_direction == Direction.LEFT
+        flashing = self.is_invulnerable and int(self.invulnerability_timer * 10) % 2 == 0
+        current_sprite = self.sprite_variants.get((sprite_name, facing_left, flashing))
 
+        if current_sprite:
             # Draw the sprite
             surface.blit(current_sprite, (int(screen_x), int(screen_y)))
 
@@ -317,3 +348,11 @@ class Player(GameObject):
                 pygame.draw.line(surface, config.COLOR_WHITE,
                                (line_x, screen_y + 20),
                                (line_x - self.facing_direction.get_value() * 6, screen_y + 20), 3)
+
+    def _log_sprite_change(self, sprite_name):
+        """Log the sprite shown whenever it changes (debug only)"""
+        if self.debug_info is None:
+            self.debug_info = PlayerDebugInfo()
+        if sprite_name != self.debug_info.last_sprite_shown:
+            log_sprites.debug("Showing: %s sprite (state: %s)", sprite_name, self.state.name)
+            self.debug_info.last_sprite_shown = sprite_name
@@ -0,0 +1,167 @@
+"""
+Entity layout benchmark
+Compares the slotted entity classes with the same attributes kept in a
+per-instance dict (the layout before __slots__): memory per instance and
+attribute access time, over thousands of instances.
+
+Usage:
+    python entity_benchmark.py --count 10000 --output entity_results.json
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import timeit
+import tracemalloc
+import pygame
+import headless
+from enums import BlockType
+
+
+def get_slot_names(cls):
+    """Get all slot names of a class, including those of its base classes"""
+    names = []
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get("__slots__", ())
+        names.extend([slots] if isinstance(slots, str) else slots)
+    return names
+
+
+def instance_size(obj):
+    """Get the shallow size of an instance in bytes (plus its dict, if any)"""
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def measure_allocation(factory, count):
+    """Measure the bytes allocated for count instances built by factory
+
+    Only the instances themselves are built, the attribute values are shared,
+    so the result is the cost of the instance layout.
+
+    Returns:
+        Bytes per instance
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [factory() for _ in range(count)]
+    allocated = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del instances
+    return allocated / count
+
+
+def measure_access(instances, names, repeats):
+    """Measure the time for reading every attribute of every instance
+
+    Returns:
+        Nanoseconds per attribute read (best of repeats)
+    """
+    reads = "\n".join(f"    obj.{name}" for name in names)
+    code = f"for obj in instances:\n{reads}"
+    best = min(timeit.repeat(code, globals={"instances": instances}, number=1, repeat=repeats))
+    return best / (len(instances) * len(names)) * 1e9
+
+
+def benchmark_entity(name, factory, count, repeats):
+    """Compare one slotted entity class with its dict layout
+
+    Args:
+        name: Name for the results
+        factory: Callable that builds a fresh instance
+        count: Number of instances
+        repeats: Timing repeats
+    """
+    sample = factory()
+    names = get_slot_names(type(sample))
+    values = {slot: getattr(sample, slot) for slot in names}
+    # One plain class per entity, so CPython can share its dict keys like it
+    # would for the original class
+    dict_layout = type(f"{name}DictLayout", (), {})
+
+    def make_slotted():
+        obj = object.__new__(type(sample))
+        for slot, value in values.items():
+            setattr(obj, slot, value)
+        return obj
+
+    def make_dict():
+        obj = dict_layout()
+        for slot, value in values.items():
+            setattr(obj, slot, value)
+        return obj
+
+    slotted = [make_slotted() for _ in range(count)]
+    dicts = [make_dict() for _ in range(count)]
+    result = {
+        "attributes": len(names),
+        "slots": {
+            "instance_bytes": instance_size(sample),
+            "allocated_bytes": measure_allocation(make_slotted, count),
+            "access_ns": measure_access(slotted, names, repeats),
+        },
+        "dict": {
+            "instance_bytes": instance_size(dicts[0]),
+            "allocated_bytes": measure_allocation(make_dict, count),
+            "access_ns": measure_access(dicts, names, repeats),
+        },
+    }
+
+    slots, dict_ = result["slots"], result["dict"]
+    print(f"{name:20s} {len(names):2d} attrs: "
+          f"{dict_['allocated_bytes']:6.0f} -> {slots['allocated_bytes']:6.0f} bytes, "
+          f"{dict_['access_ns']:5.1f} -> {slots['access_ns']:5.1f} ns/read")
+    return result
+
+
+def run(count, repeats):
+    """Run the benchmark for all slotted entity classes"""
+    from entities.block import Block
+    from entities.enemy import Enemy
+    from entities.enemy_manager import EnemyManager
+    from entities.player import AnimationController, Player
+
+    headless.init_headless()  # Player loads its sprites
+    manager = EnemyManager([(0.0, 0.0)])
+    entities = {
+        "Player": lambda: Player(0, 0),
+        "AnimationController": AnimationController,
+        "Enemy": lambda: Enemy(manager, 0),
+        "Block": lambda: Block(0, 0, BlockType.GROUND),
+    }
+
+    results = {
+        "meta": {
+            "count": count,
+            "repeats": repeats,
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "entities": {},
+    }
+    for name, factory in entities.items():
+        results["entities"][name] = benchmark_entity(name, factory, count, repeats)
+    return results
+
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark StoneRush entity memory layout")
+    parser.add_argument("--count", type=int, default=10000, help="Instances per entity class")
+    parser.add_argument("--repeats", type=int, default=5, help="Timing repeats (best is kept)")
+    parser.add_argument("--output", default="entity_results.json", help="JSON output path")
+    args = parser.parse_args()
+
+    results = run(args.count, args.repeats)
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
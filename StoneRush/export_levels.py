@@ -0,0 +1,51 @@
+"""
+Level export
+Writes the generated levels to level files, so the game loads them from
+disk instead of running the generator at startup.
+
+Usage:
+    python export_levels.py                  # Levels 1-10 into levels/
+    python export_levels.py --levels 3 4 --output-dir my_levels
+"""
+import argparse
+import os
+import config
+from world.level import Level
+
+
+NUM_LEVELS = 10
+
+
+def export_level(level_number, output_dir):
+    """Generate a level and write it (plus its JSON sidecar) to output_dir
+
+    Returns:
+        Path of the written level file
+    """
+    data = Level._create_level_data(level_number)
+    data.metadata = {
+        "name": f"Level {level_number}",
+        "source": "generated",
+        "level_number": level_number,
+    }
+    path = os.path.join(output_dir, f"level_{level_number:02d}.srl")
+    data.save(path)
+    return path
+
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Export generated StoneRush levels to level files")
+    parser.add_argument("--levels", type=int, nargs="+", default=list(range(1, NUM_LEVELS + 1)),
+                        help="Levels to export (default: all)")
+    parser.add_argument("--output-dir", default=config.LEVELS_DIR, help="Directory for the level files")
+    args = parser.parse_args()
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    for level_number in args.levels:
+        path = export_level(level_number, args.output_dir)
+        print(f"Level {level_number}: {path} ({os.path.getsize(path)} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""
+Frame profiler for per-phase timings
+"""
+from collections import deque
+import math
+import time
+import pygame
+import config
+
+
+def summarize(samples):
+    """Summarize timing samples (in seconds) as milliseconds
+
+    Returns:
+        Dict with count, mean, p50, p95, p99 and max
+    """
+    if not samples:
+        return {"count": 0, "mean": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+
+    ordered = sorted(samples)
+    count = len(ordered)
+
+    def percentile(p):
+        # Nearest-rank percentile
+        index = max(0, math.ceil(p / 100.0 * count) - 1)
+        return ordered[index] * 1000.0
+
+    return {
+        "count": count,
+        "mean": sum(ordered) / count * 1000.0,
+        "p50": percentile(50),
+        "p95": percentile(95),
+        "p99": percentile(99),
+        "max": ordered[-1] * 1000.0,
+    }
+
+
+class NullProfiler:
+    """Profiler that records nothing (used while profiling is off)"""
+
+    def begin(self):
+        pass
+
+    def lap(self, name):
+        pass
+
+
+class FrameProfiler:
+    """Records the time spent in each named phase of a frame
+
+    Call begin() at the start of a frame and lap(name) at the end of every
+    phase; each lap records the time since the previous lap (or begin).
+    """
+
+    def __init__(self, history=None):
+        """Create a profiler
+
+        Args:
+            history: Keep only the last N samples per phase (None = keep all)
+        """
+        self.history = history
+        self.samples = {}  # Phase name -> list (or bounded deque) of durations in seconds
+        self._last = 0.0
+
+    def begin(self):
+        """Start timing a new frame"""
+        self._last = time.perf_counter()
+
+    def lap(self, name):
+        """Record the time since the last lap under the given phase name"""
+        now = time.perf_counter()
+        samples = self.samples.get(name)
+        if samples is None:
+            samples = self.samples[name] = deque(maxlen=self.history) if self.history else []
+        samples.append(now - self._last)
+        self._last = now
+
+    def reset(self):
+        """Drop all recorded samples"""
+        self.samples.clear()
+
+    def get_summary(self):
+        """Get summarize() statistics for every phase"""
+        return {name: summarize(samples) for name, samples in self.samples.items()}
+
+
+class ProfilerOverlay:
+    """On-screen panel with rolling per-phase timings and a frame-time graph
+
+    While hidden nothing is recorded; the screen keeps using a NullProfiler.
+    """
+
+    HISTORY = 240  # Frames (and samples per phase) in the rolling window
+    TEXT_REFRESH_FRAMES = 15  # Re-render the text every N frames
+    WIDTH = 300
+    LINE_HEIGHT = 16
+    VALUE_COLUMNS = (220, 290)  # Right edges of the mean / p99 columns
+    GRAPH_HEIGHT = 60
+    GRAPH_MAX_MS = 2000.0 / config.TARGET_FPS  # Top of the graph: two target frames
+    BACKGROUND_COLOR = (0, 0, 0, 170)
+    TEXT_COLOR = (255, 255, 255)
+    BAR_COLOR = (80, 220, 80)
+    SLOW_BAR_COLOR = (230, 60, 60)
+    TARGET_LINE_COLOR = (255, 220, 0)
+
+    def __init__(self, history=HISTORY):
+        self.profiler = FrameProfiler(history)
+        self.frame_times = deque(maxlen=history)
+        self.visible = False
+        self.font = None
+        self.text_rows = []
+        self._frames_since_text = 0
+        self._last_frame = None
+
+    def toggle(self):
+        """Show or hide the overlay (starts a fresh window when shown)"""
+        self.visible = not self.visible
+        self.profiler.reset()
+        self.frame_times.clear()
+        self.text_rows = []
+        self._frames_since_text = self.TEXT_REFRESH_FRAMES
+        self._last_frame = None
+
+    def record_frame(self):
+        """Record the wall time since the previous rendered frame"""
+        now = time.perf_counter()
+        if self._last_frame is not None:
+            self.frame_times.append(now - self._last_frame)
+        self._last_frame = now
+
+    def _build_text(self, extra_lines):
+        """Render the statistics as rows of (label, right-aligned values)"""
+        if self.font is None:
+            self.font = pygame.font.Font(None, 20)
+
+        frame = summarize(self.frame_times)
+        rows = [
+            ("Last frames (ms)", "mean", "p99"),
+            ("frame time", f"{frame['mean']:.2f}", f"{frame['p99']:.2f}"),
+        ]
+        for name, stats in self.profiler.get_summary().items():
+            rows.append((name, f"{stats['mean']:.3f}", f"{stats['p99']:.3f}"))
+        rows.extend((line,) for line in extra_lines)
+
+        render = self.font.render
+        self.text_rows = [[render(cell, True, self.TEXT_COLOR) for cell in row] for row in rows]
+
+    def render(self, surface, extra_lines=()):
+        """Draw the overlay in the top-right corner
+
+        Args:
+            surface: Pygame surface to render to
+            extra_lines: Additional text lines (e.g. culling counts)
+        """
+        self._frames_since_text += 1
+        if self._frames_since_text >= self.TEXT_REFRESH_FRAMES:
+            self._build_text(extra_lines)
+            self._frames_since_text = 0
+
+        height = len(self.text_rows) * self.LINE_HEIGHT + self.GRAPH_HEIGHT + 15
+        x = surface.get_width() - self.WIDTH - 10
+        y = 10
+
+        panel = pygame.Surface((self.WIDTH, height), pygame.SRCALPHA)
+        panel.fill(self.BACKGROUND_COLOR)
+        surface.blit(panel, (x, y))
+
+        for i, row in enumerate(self.text_rows):
+            row_y = y + 5 + i * self.LINE_HEIGHT
+            surface.blit(row[0], (x + 5, row_y))
+            for value, column_right in zip(row[1:], self.VALUE_COLUMNS):
+                surface.blit(value, (x + column_right - value.get_width(), row_y))
+
+        # Frame-time graph: one bar per frame, newest on the right
+        graph_bottom = y + height - 5
+        scale = self.GRAPH_HEIGHT / self.GRAPH_MAX_MS
+        target_ms = 1000.0 / config.TARGET_FPS
+        bar_x = x + self.WIDTH - 5 - len(self.frame_times)
+        for frame_time in self.frame_times:
+            frame_ms = frame_time * 1000.0
+            bar_height = min(self.GRAPH_HEIGHT, int(frame_ms * scale))
+            color = self.SLOW_BAR_COLOR if frame_ms > target_ms * 1.5 else self.BAR_COLOR
+            pygame.draw.line(surface, color, (bar_x, graph_bottom), (bar_x, graph_bottom - bar_height))
+            bar_x += 1
+
+        target_y = graph_bottom - int(target_ms * scale)
+        pygame.draw.line(surface, self.TARGET_LINE_COLOR, (x + 5, target_y), (x + self.WIDTH - 5, target_y))
@@ -0,0 +1,115 @@
+"""
+Headless simulation
+Runs the game screen without a window, audio or display flip, driven by
+scripted input. Used for soak tests and performance measurements.
+
+Usage:
+    python headless.py --frames 10000 --level 3
+    python headless.py --frames 2000 --hz 30   # Fewer, longer steps
+"""
+import argparse
+import os
+import time
+import pygame
+import config
+import debug_log
+from systems.input_system import InputState, ScriptedInput
+
+
+# Default input pattern: run right, hop, and ram every few seconds
+DEFAULT_SCRIPT = [
+    (60, InputState(right=True)),
+    (1, InputState(right=True, jump=True)),
+    (59, InputState(right=True)),
+    (20, InputState(right=True, ram=True)),
+    (40, InputState(right=True)),
+    (1, InputState(right=True, jump=True)),
+    (30, InputState(right=True)),
+    (30, InputState(left=True)),
+    (20, InputState()),
+]
+
+
+def init_headless():
+    """Initialize pygame without a real window or audio device
+
+    Returns:
+        Offscreen display surface of window size (needed for convert_alpha())
+    """
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+    # Only the modules the simulation needs - no pygame.init(), so no mixer
+    pygame.display.init()
+    pygame.font.init()
+    return pygame.display.set_mode((config.WINDOW_WIDTH, config.WINDOW_HEIGHT))
+
+
+def create_game_screen(level_number=1, script=None):
+    """Create and show a GameScreen with audio disabled and scripted input"""
+    # Imported here so sprites are only loaded after the display exists
+    from screens.game_screen import GameScreen
+
+    input_source = ScriptedInput(script or DEFAULT_SCRIPT)
+    screen = GameScreen(level_number, enable_audio=False, input_source=input_source)
+    screen.show()
+    return screen
+
+
+def run(frames, level_number=1, delta=config.FIXED_TIMESTEP, render=False, script=None):
+    """Simulate a number of frames as fast as possible
+
+    Args:
+        frames: Number of frames to simulate
+        level_number: Level to start on
+        delta: Fixed time step per frame in seconds
+        render: Also render every frame to an offscreen surface
+        script: Optional input script (list of (frame_count, InputState))
+
+    Returns:
+        Dict with the frame count, elapsed time and frames per second
+    """
+    surface = init_headless()
+    screen = create_game_screen(level_number, script)
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        screen.update(delta)
+        if render:
+            screen.render(surface)
+    elapsed = time.perf_counter() - start
+
+    screen.dispose()
+    return {
+        "frames": frames,
+        "level": level_number,
+        "seconds": elapsed,
+        "fps": frames / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Run StoneRush headless")
+    parser.add_argument("--frames", type=int, default=10000, help="Number of frames to simulate")
+    parser.add_argument("--level", type=int, default=1, help="Level to start on (1-10)")
+    parser.add_argument("--hz", type=float, default=config.SIMULATION_HZ,
+                        help="Simulation steps per simulated second (lower = bigger steps)")
+    parser.add_argument("--render", action="store_true", help="Also render to an offscreen surface")
+    parser.add_argument("--log", default=None, help="Diagnostic log categories (see debug_log)")
+    args = parser.parse_args()
+    try:
+        debug_log.configure(args.log)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.hz <= 0:
+        parser.error("--hz must be positive")
+
+    result = run(args.frames, args.level, delta=1.0 / args.hz, render=args.render)
+    print(f"Level {result['level']}: {result['frames']} frames in {result['seconds']:.2f}s "
+          f"({result['fps']:.0f} frames/s)")
+
+
+if __name__ == "__main__":
+    main()
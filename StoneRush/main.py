@@ -7,11 +7,18 @@ Controls:
 - Space: Jump
 - Shift: Ram attack
 - Escape: Quit game
+- F3: Toggle frame profiler overlay
+
+Options:
+- --log SPEC: Enable diagnostic logging, e.g. --log collision,state=info
+  (same format as the STONERUSH_LOG environment variable)
 """
+import argparse
 import pygame
 import sys
 from screens.game_screen import GameScreen
 import config
+import debug_log
 
 
 class StoneRushGame:
@@ -40,6 +47,9 @@ class StoneRushGame:
         self.current_screen = GameScreen()
         self.current_screen.show()
 
+        # Simulation time not yet consumed by fixed steps
+        accumulator = 0.0
+
         while self.running:
             # Calculate delta time (in seconds)
             delta = self.clock.tick(config.TARGET_FPS) / 1000.0
@@ -48,12 +58,16 @@ class StoneRushGame:
             self._handle_events()
 
             # Update
+            alpha = 1.0
             if self.current_screen:
-                self.current_screen.update(delta)
+                if config.USE_FIXED_TIMESTEP:
+                    accumulator, alpha = self._run_fixed_steps(accumulator + delta)
+                else:
+                    self.current_screen.update(delta)
 
-            # Render
+            # Render (interpolated between the last two simulation steps)
             if self.current_screen:
-                self.current_screen.render(self.screen)
+                self.current_screen.render(self.screen, alpha)
 
             # Update display
             pygame.display.flip()
@@ -61,6 +75,28 @@ class StoneRushGame:
         # Cleanup
         self._quit()
 
+    def _run_fixed_steps(self, accumulator):
+        """Consume the accumulated frame time in fixed simulation steps
+
+        Args:
+            accumulator: Unsimulated time in seconds
+
+        Returns:
+            Tuple (remaining accumulator, interpolation alpha for rendering)
+        """
+        step = config.FIXED_TIMESTEP
+        steps = 0
+        while accumulator >= step and steps < config.MAX_SIMULATION_STEPS:
+            self.current_screen.update(step)
+            accumulator -= step
+            steps += 1
+
+        # After a long hitch drop the backlog instead of trying to catch up
+        if accumulator >= step:
+            accumulator = 0.0
+
+        return accumulator, accumulator / step
+
     def _handle_events(self):
         """Handle Pygame events"""
         for event in pygame.event.get():
@@ -69,6 +105,8 @@ class StoneRushGame:
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self.running = False
+                elif event.key == pygame.K_F3 and self.current_screen:
+                    self.current_screen.toggle_profiler_overlay()
 
     def _quit(self):
         """Clean up and quit"""
@@ -80,6 +118,16 @@ class StoneRushGame:
 
 def main():
     """Entry point"""
+    parser = argparse.ArgumentParser(description=config.GAME_TITLE)
+    parser.add_argument("--log", default=None,
+                        help=f"Diagnostic log categories ({', '.join(debug_log.CATEGORIES)}), "
+                             f"overrides ${debug_log.ENV_VAR}")
+    args = parser.parse_args()
+    try:
+        debug_log.configure(args.log)
+    except ValueError as e:
+        parser.error(str(e))
+
     game = StoneRushGame()
     game.run()
 
@@ -3,61 +3,92 @@ Particle system for visual effects
 """
 import pygame
 import random
-import math
+import numpy as np
 
 
-class Particle:
-    """Single particle with position, velocity, and lifetime"""
+class ParticleSpriteCache:
+    """Pre-rendered particle sprites keyed by color, size and alpha bucket
 
-    def __init__(self, x, y, color):
-        self.x = x
-        self.y = y
-        self.vx = random.uniform(-150, 150)  # Random horizontal velocity
-        self.vy = random.uniform(-200, -50)  # Random upward velocity
-        self.color = color
-        self.lifetime = 0.5  # 0.5 seconds
-        self.max_lifetime = 0.5
-        self.size = random.uniform(2, 4)  # Random size between 2-4 pixels
+    Sprites are drawn on first use and then reused, so rendering a particle
+    is a single blit instead of a Surface allocation plus a circle draw.
+    """
 
-    def update(self, delta):
-        """Update particle position and lifetime"""
-        # Apply velocity
-        self.x += self.vx * delta
-        self.y += self.vy * delta
-
-        # Apply gravity
-        self.vy += 400 * delta  # Gravity effect
-
-        # Reduce lifetime
-        self.lifetime -= delta
-
-    def is_dead(self):
-        """Check if particle should be removed"""
-        return self.lifetime <= 0
+    ALPHA_BUCKETS = 16
+    MAX_ENTRIES = 512
 
-    def render(self, surface, camera_offset):
-        """Render the particle"""
-        screen_x = self.x - camera_offset[0]
-        screen_y = self.y - camera_offset[1]
+    def __init__(self):
+        self.sprites = {}
 
-        # Calculate alpha based on remaining lifetime (fade out)
-        alpha_ratio = self.lifetime / self.max_lifetime
-        alpha = int(255 * alpha_ratio)
+    def get(self, color, diameter, alpha_bucket):
+        """Get the sprite for a particle
 
-        # Create a surface with alpha for transparency
-        particle_surface = pygame.Surface((int(self.size * 2), int(self.size * 2)), pygame.SRCALPHA)
-        color_with_alpha = (*self.color, alpha)
-        pygame.draw.circle(particle_surface, color_with_alpha,
-                         (int(self.size), int(self.size)), int(self.size))
+        Args:
+            color: RGB tuple
+            diameter: Sprite size in pixels (int(particle size * 2))
+            alpha_bucket: Alpha quantized to 0..ALPHA_BUCKETS - 1
+        """
+        key = (color, diameter, alpha_bucket)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            # Keep the cache bounded; all entries are cheap to rebuild
+            if len(self.sprites) >= self.MAX_ENTRIES:
+                self.sprites.clear()
 
-        surface.blit(particle_surface, (int(screen_x - self.size), int(screen_y - self.size)))
+            alpha = alpha_bucket * 255 // (self.ALPHA_BUCKETS - 1)
+            radius = diameter // 2
+            sprite = pygame.Surface((diameter, diameter), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, (*color, alpha), (radius, radius), radius)
+            self.sprites[key] = sprite
+        return sprite
 
 
 class ParticleSystem:
-    """Manages all particles in the game"""
-
-    def __init__(self):
-        self.particles = []
+    """Manages all particles in the game
+
+    Particles are stored as a struct of arrays: one preallocated NumPy array
+    per attribute, with the live particles packed into the first `count`
+    slots. Integration, gravity and removal of dead particles run as
+    vectorized operations instead of one Python object per particle.
+    """
+
+    INITIAL_CAPACITY = 256
+    GRAVITY = 400.0
+    LIFETIME = 0.5  # 0.5 seconds
+
+    # Colors: gray and brown particles
+    COLORS = (
+        (128, 128, 128),  # Gray
+        (153, 102, 51),   # Brown
+        (127, 76, 25),    # Dark brown
+        (100, 100, 100),  # Dark gray
+    )
+
+    # Sprite cache shared by all particle systems
+    _sprite_cache = None
+
+    def __init__(self, capacity=INITIAL_CAPACITY):
+        self.count = 0
+        self.rng = np.random.default_rng()
+        self._allocate(capacity)
+
+        if ParticleSystem._sprite_cache is None:
+            ParticleSystem._sprite_cache = ParticleSpriteCache()
+
+    def _allocate(self, capacity):
+        """Allocate (or grow) the particle arrays, keeping live particles"""
+        old = getattr(self, "x", None)
+        fields = {
+            "x": np.float32, "y": np.float32,
+            "vx": np.float32, "vy": np.float32,
+            "lifetime": np.float32, "size": np.float32,
+            "color": np.uint8,  # Index into COLORS
+        }
+        for name, dtype in fields.items():
+            array = np.zeros(capacity, dtype=dtype)
+            if old is not None:
+                array[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, array)
+        self.capacity = capacity
 
     def spawn_ram_particles(self, x, y, direction):
         """Spawn particles when player rams
@@ -70,41 +101,97 @@ class ParticleSystem:
         # Spawn 5-8 particles
         num_particles = random.randint(5, 8)
 
-        # Colors: gray and brown particles
-        colors = [
-            (128, 128, 128),  # Gray
-            (153, 102, 51),   # Brown
-            (127, 76, 25),    # Dark brown
-            (100, 100, 100),  # Dark gray
-        ]
-
-        for _ in range(num_particles):
-            # Random offset around the spawn point
-            offset_x = random.uniform(-10, 10)
-            offset_y = random.uniform(-10, 10)
-
-            particle = Particle(x + offset_x, y + offset_y, random.choice(colors))
+        start = self.count
+        end = start + num_particles
+        if end > self.capacity:
+            self._allocate(max(end, self.capacity * 2))
 
-            # Adjust velocity based on direction
-            # Particles should fly in the direction of movement
-            particle.vx = random.uniform(50, 200) * direction
+        rng = self.rng
+        # Random offset around the spawn point
+        self.x[start:end] = x + rng.uniform(-10, 10, num_particles)
+        self.y[start:end] = y + rng.uniform(-10, 10, num_particles)
+        # Particles should fly in the direction of movement, and upwards
+        self.vx[start:end] = rng.uniform(50, 200, num_particles) * direction
+        self.vy[start:end] = rng.uniform(-200, -50, num_particles)
+        self.lifetime[start:end] = self.LIFETIME
+        self.size[start:end] = rng.uniform(2, 4, num_particles)  # 2-4 pixels
+        self.color[start:end] = rng.integers(0, len(self.COLORS), num_particles)
 
-            self.particles.append(particle)
+        self.count = end
 
     def update(self, delta):
         """Update all particles"""
-        # Update each particle
-        for particle in self.particles:
-            particle.update(delta)
+        n = self.count
+        if n == 0:
+            return
+
+        # Apply velocity, then gravity, then reduce lifetime
+        vx = self.vx[:n]
+        vy = self.vy[:n]
+        self.x[:n] += vx * delta
+        self.y[:n] += vy * delta
+        vy += self.GRAVITY * delta
+        lifetime = self.lifetime[:n]
+        lifetime -= delta
+
+        # Remove dead particles by packing the live ones to the front
+        alive = lifetime > 0
+        alive_count = int(np.count_nonzero(alive))
+        if alive_count != n:
+            for array in (self.x, self.y, self.vx, self.vy, self.lifetime, self.size, self.color):
+                array[:alive_count] = array[:n][alive]
+            self.count = alive_count
+
+    def render(self, surface, camera_offset, culler=None):
+        """Render all particles
 
-        # Remove dead particles
-        self.particles = [p for p in self.particles if not p.is_dead()]
-
-    def render(self, surface, camera_offset):
-        """Render all particles"""
-        for particle in self.particles:
-            particle.render(surface, camera_offset)
+        Args:
+            surface: Pygame surface to render to
+            camera_offset: Tuple (x, y) for camera offset
+            culler: Optional ViewCuller that skips and counts off-screen particles
+        """
+        n = self.count
+        if n == 0:
+            return
+
+        x = self.x[:n]
+        y = self.y[:n]
+        size = self.size[:n]
+        lifetime = self.lifetime[:n]
+        color = self.color[:n]
+
+        if culler:
+            view = culler.view
+            visible = ((x + size >= view.left) & (x - size <= view.right) &
+                       (y + size >= view.top) & (y - size <= view.bottom))
+            visible_count = int(np.count_nonzero(visible))
+            culler.record(visible_count, n - visible_count)
+            if visible_count != n:
+                x, y, size = x[visible], y[visible], size[visible]
+                lifetime, color = lifetime[visible], color[visible]
+
+        # Sprite size and top-left corner (int() truncation, as for any blit)
+        diameter = (size * 2).astype(np.int32).tolist()
+        blit_x = (x - size - camera_offset[0]).astype(np.int32).tolist()
+        blit_y = (y - size - camera_offset[1]).astype(np.int32).tolist()
+
+        # Alpha bucket based on remaining lifetime (fade out)
+        buckets = ParticleSpriteCache.ALPHA_BUCKETS - 1
+        alpha_bucket = np.clip(lifetime / self.LIFETIME * buckets + 0.5, 0, buckets).astype(np.int32).tolist()
+
+        # Submit all particles in one batched blit
+        cache = ParticleSystem._sprite_cache
+        colors = self.COLORS
+        surface.blits(
+            [(cache.get(colors[c], d, a), (bx, by))
+             for c, d, a, bx, by in zip(color.tolist(), diameter, alpha_bucket, blit_x, blit_y)],
+            doreturn=False
+        )
+
+    def get_particle_count(self):
+        """Get the number of live particles"""
+        return self.count
 
     def clear(self):
         """Remove all particles"""
-        self.particles.clear()
+        self.count = 0
@@ -0,0 +1,222 @@
+"""
+Asset processing
+Turns imported screenshots into game sprites: color keying (background to
+transparent), cropping to the bounding box and resizing. Keying and
+cropping work on NumPy arrays (whole-image masks instead of per-pixel
+loops), and many files are processed in parallel with a process pool.
+
+Which files become which sprite, and the thresholds per file, come from a
+JSON config (default: assets.json in the input directory):
+
+    {
+      "keys": {"sky": {"min": [0, 171, 201], "max": [199, 255, 255]}},
+      "defaults": {"key": "sky", "crop": true, "size": [32, 32]},
+      "assets": {"Screenshot 1.png": {"output": "block_ground.png", "crop": false}}
+    }
+
+"key" is a name from "keys", an inline {"min", "max"} RGB range or null (no
+keying); "size" is [width, height] or null (keep the size). Settings of an
+asset override the defaults. Run build_atlas.py afterwards.
+
+Usage:
+    python process_assets.py                          # Every asset in import/assets.json
+    python process_assets.py "Screenshot 2.png"       # Only some files (defaults if not listed)
+    python process_assets.py --all --jobs 8 --input-dir import --output-dir assets
+"""
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from PIL import Image
+
+
+BASE_DIR = os.path.dirname(__file__)
+DEFAULT_INPUT_DIR = os.path.join(BASE_DIR, "import")
+DEFAULT_OUTPUT_DIR = os.path.join(BASE_DIR, "assets")
+CONFIG_NAME = "assets.json"
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+
+DEFAULT_SETTINGS = {"key": None, "crop": True, "size": None}
+
+
+def key_background(pixels, key_min, key_max):
+    """Make every pixel within an RGB range (and every transparent pixel) fully transparent
+
+    Args:
+        pixels: RGBA uint8 array [row, column, channel], changed in place
+        key_min: Lowest (r, g, b) that counts as background
+        key_max: Highest (r, g, b) that counts as background
+
+    Returns:
+        Number of keyed pixels
+    """
+    rgb = pixels[..., :3]
+    mask = np.all((rgb >= key_min) & (rgb <= key_max), axis=2)
+    mask |= pixels[..., 3] == 0
+    pixels[mask] = 0
+    return int(np.count_nonzero(mask))
+
+
+def crop_to_content(pixels):
+    """Crop to the bounding box of the non-transparent pixels
+
+    Returns:
+        View of the cropped pixels (unchanged if everything is transparent)
+    """
+    opaque = pixels[..., 3] > 0
+    rows = np.flatnonzero(opaque.any(axis=1))
+    cols = np.flatnonzero(opaque.any(axis=0))
+    if not len(rows):
+        return pixels
+    return pixels[rows[0]:rows[-1] + 1, cols[0]:cols[-1] + 1]
+
+
+def process_asset(input_path, output_path, settings):
+    """Key, crop and resize one image and save it as PNG
+
+    Args:
+        input_path: Source image
+        output_path: Output PNG
+        settings: Resolved settings (see resolve_settings)
+
+    Returns:
+        Dict with input/output sizes, keyed pixel count and time in ms
+    """
+    start = time.perf_counter()
+    with Image.open(input_path) as img:
+        pixels = np.array(img.convert("RGBA"))
+    input_size = (pixels.shape[1], pixels.shape[0])
+
+    keyed = 0
+    if settings["key"] is not None:
+        keyed = key_background(pixels, settings["key"]["min"], settings["key"]["max"])
+    if settings["crop"]:
+        pixels = crop_to_content(pixels)
+
+    img = Image.fromarray(np.ascontiguousarray(pixels), "RGBA")
+    if settings["size"] and img.size != tuple(settings["size"]):
+        # Pillow resizes RGBA with premultiplied alpha, so keyed pixels do not bleed
+        img = img.resize(tuple(settings["size"]), Image.Resampling.LANCZOS)
+    img.save(output_path)
+
+    return {
+        "input": input_path,
+        "output": output_path,
+        "input_size": input_size,
+        "output_size": img.size,
+        "keyed_pixels": keyed,
+        "ms": (time.perf_counter() - start) * 1000.0,
+    }
+
+
+def _process_job(job):
+    """Process pool entry point (one picklable argument)"""
+    return process_asset(*job)
+
+
+def load_config(path):
+    """Load the asset config (empty config if the file does not exist)"""
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def resolve_settings(config, name):
+    """Get the settings for one input file: defaults, overridden by the asset's entry
+
+    Returns:
+        Dict with output, key ({"min", "max"} or None), crop and size
+
+    Raises:
+        ValueError: If the asset names an unknown key
+    """
+    settings = dict(DEFAULT_SETTINGS)
+    settings.update(config.get("defaults", {}))
+    settings.update(config.get("assets", {}).get(name, {}))
+    settings.setdefault("output", os.path.splitext(name)[0] + ".png")
+
+    key = settings["key"]
+    if isinstance(key, str):
+        if key not in config.get("keys", {}):
+            raise ValueError(f"{name}: unknown key '{key}'")
+        key = config["keys"][key]
+    if key is not None:
+        key = {"min": np.array(key["min"], dtype=np.uint8), "max": np.array(key["max"], dtype=np.uint8)}
+    settings["key"] = key
+    return settings
+
+
+def collect_jobs(input_dir, output_dir, config, names=None, include_all=False):
+    """Build the (input path, output path, settings) jobs
+
+    Args:
+        input_dir: Directory with the source images
+        output_dir: Directory for the processed sprites
+        config: Asset config
+        names: Only these input files (None: the assets in the config)
+        include_all: Also process images in input_dir not listed in the config
+
+    Raises:
+        ValueError: If an input file is missing or its settings are invalid
+    """
+    if names is None:
+        names = list(config.get("assets", {}))
+        if include_all:
+            names += sorted(name for name in os.listdir(input_dir)
+                            if name.lower().endswith(IMAGE_EXTENSIONS) and name not in names)
+
+    jobs = []
+    for name in names:
+        input_path = os.path.join(input_dir, name)
+        if not os.path.isfile(input_path):
+            raise ValueError(f"{input_path}: no such file")
+        settings = resolve_settings(config, name)
+        jobs.append((input_path, os.path.join(output_dir, settings["output"]), settings))
+    return jobs
+
+
+def run(jobs, workers):
+    """Process all jobs, in parallel if there is more than one worker and job
+
+    Returns:
+        List of process_asset() results, in job order
+    """
+    if workers <= 1 or len(jobs) <= 1:
+        return [_process_job(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as executor:
+        return list(executor.map(_process_job, jobs))
+
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Key, crop and resize imported StoneRush sprites")
+    parser.add_argument("files", nargs="*", help="Input files to process (default: all in the config)")
+    parser.add_argument("--input-dir", default=DEFAULT_INPUT_DIR, help="Directory with the source images")
+    parser.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR, help="Directory for the sprites")
+    parser.add_argument("--config", default=None, help=f"Asset config (default: <input-dir>/{CONFIG_NAME})")
+    parser.add_argument("--all", action="store_true", help="Also process images not listed in the config")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Worker processes")
+    args = parser.parse_args()
+
+    config = load_config(args.config or os.path.join(args.input_dir, CONFIG_NAME))
+    try:
+        jobs = collect_jobs(args.input_dir, args.output_dir, config, args.files or None, args.all)
+    except ValueError as e:
+        parser.error(str(e))
+    if not jobs:
+        parser.error("nothing to process (no files given and no assets in the config)")
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    start = time.perf_counter()
+    for result in run(jobs, args.jobs):
+        print(f"{os.path.basename(result['input'])} {result['input_size']} -> "
+              f"{os.path.basename(result['output'])} {result['output_size']}, "
+              f"{result['keyed_pixels']} keyed, {result['ms']:.1f} ms")
+    print(f"Processed {len(jobs)} files in {(time.perf_counter() - start) * 1000.0:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,16 +6,29 @@ from abc import ABC, abstractmethod
 
 
 class BaseScreen(ABC):
-    """Abstract base class for game screens"""
+    """Abstract base class for game screens
+
+    Lifecycle: create() runs once for resources that live as long as the
+    screen, show() runs every time the screen becomes active, hide() when it
+    stops being active, and dispose() releases what create() set up.
+    """
 
     def __init__(self):
-        pass
+        self.created = False
+
+    def create(self):
+        """One-time setup (fonts, audio, systems); called before the first show()"""
+        self.created = True
 
     @abstractmethod
     def show(self):
         """Called when this screen becomes active"""
         pass
 
+    def hide(self):
+        """Called when this screen stops being active"""
+        pass
+
     @abstractmethod
     def update(self, delta):
         """Update screen logic
@@ -26,11 +39,13 @@ class BaseScreen(ABC):
         pass
 
     @abstractmethod
-    def render(self, surface):
+    def render(self, surface, alpha=1.0):
         """Render the screen
 
         Args:
             surface: Pygame surface to render to
+            alpha: Interpolation factor between the previous and the current
+                simulation step (0.0-1.0)
         """
         pass
 
@@ -43,6 +58,10 @@ class BaseScreen(ABC):
         """
         pass
 
-    def dispose(self):
-        """Clean up resources"""
+    def toggle_profiler_overlay(self):
+        """Show or hide the frame profiler overlay (if the screen has one)"""
         pass
+
+    def dispose(self):
+        """Clean up resources created in create()"""
+        self.created = False
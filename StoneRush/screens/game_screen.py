@@ -6,18 +6,31 @@ import pygame
 from screens.base_screen import BaseScreen
 from world.level import Level
 from world.camera import Camera
+from world.view_culler import ViewCuller
 from systems.physics_system import PhysicsSystem
 from systems.collision_system import CollisionSystem
 from systems.input_system import InputSystem
 from sprite_manager import SpriteManager
 from particle_system import ParticleSystem
+from frame_profiler import NullProfiler, ProfilerOverlay
+from debug_log import get_logger
 import config
 
 
+log = get_logger("assets")
+
+
 class GameScreen(BaseScreen):
     """Main gameplay screen"""
 
-    def __init__(self):
+    def __init__(self, level_number=1, enable_audio=True, input_source=None):
+        """Create the game screen
+
+        Args:
+            level_number: Level to start on (1-10)
+            enable_audio: Initialize the mixer and play music (False for headless runs)
+            input_source: Optional input source for InputSystem (default: keyboard)
+        """
         super().__init__()
         self.level = None
         self.player = None
@@ -26,96 +39,166 @@ class GameScreen(BaseScreen):
         self.collision_system = None
         self.input_system = None
         self.particle_system = None
+        self.culler = ViewCuller()
+        self.profiler = NullProfiler()  # Swap in a FrameProfiler to time each phase
+        self.profiler_overlay = ProfilerOverlay()
         self.game_over = False
         self.level_complete = False
         self.victory = False  # True when all 10 levels completed
-        self.current_level = 1  # Track current level (1-10)
+        self.current_level = level_number  # Track current level (1-10)
+        self.enable_audio = enable_audio
+        self.input_source = input_source
         self.font = None
         self.sprite_manager = SpriteManager()
         self.background = None
         self.transition_timer = 0  # Timer for level transition
 
-    def show(self):
-        """Initialize the game screen"""
-        # Initialize level with current level number (this creates the player too)
-        self.level = Level(self.current_level)
-        self.player = self.level.get_player()
+    def create(self):
+        """One-time setup: systems, background, font and music"""
+        super().create()
 
-        # Initialize systems
+        # Initialize systems (bound to a level/player in load_level)
         self.physics_system = PhysicsSystem()
-        self.collision_system = CollisionSystem(self.level)
-        self.input_system = InputSystem(self.player)
+        self.collision_system = CollisionSystem(None)
+        self.input_system = InputSystem(None, self.input_source)
         self.particle_system = ParticleSystem()
+        self.camera = Camera(None)
 
-        # Set particle system for player
-        self.player.set_particle_system(self.particle_system)
-
-        # Initialize camera
-        self.camera = Camera(self.player)
-
-        # Load background and scale it to window size
-        bg_image = self.sprite_manager.get_sprite("background")
-        self.background = pygame.transform.scale(bg_image, (config.WINDOW_WIDTH, config.WINDOW_HEIGHT))
+        # Background is already window-sized (see SpriteManager)
+        self.background = self.sprite_manager.get_sprite("background")
 
         # Initialize font for UI
         pygame.font.init()
         self.font = pygame.font.Font(None, 36)
 
         # Initialize and play background music
-        pygame.mixer.init()
-        music_path = r"C:\@Martin\MADDIN\StoneRush\import\ovrworld.wav"
-        pygame.mixer.music.load(music_path)
-        pygame.mixer.music.play(-1)  # -1 = infinite loop
+        if self.enable_audio:
+            self._start_music()
+
+    def show(self):
+        """Initialize the game screen (resources once, then the current level)"""
+        if not self.created:
+            self.create()
+        self.load_level(self.current_level)
+
+    def load_level(self, level_number):
+        """Build a level and bind the systems to it (per-level setup only)"""
+        self.current_level = level_number
+
+        # Initialize level with current level number (this creates the player too)
+        self.level = Level(level_number)
+        self.player = self.level.get_player()
+
+        # Point the systems at the new level and player
+        self.collision_system.set_level(self.level)
+        self.input_system.set_player(self.player)
+        self.particle_system.clear()
+        self.player.set_particle_system(self.particle_system)
+        self.camera.set_level_size(self.level.get_pixel_width(), self.level.get_pixel_height())
+        self.camera.set_target(self.player)
 
         self.game_over = False
         self.level_complete = False
+        self.transition_timer = 0
+
+    def dispose(self):
+        """Stop the music and release the level"""
+        if self.enable_audio and pygame.mixer.get_init():
+            pygame.mixer.music.stop()
+            pygame.mixer.quit()
+        self.level = None
+        self.player = None
+        super().dispose()
+
+    def _start_music(self):
+        """Initialize the mixer and loop the background music"""
+        try:
+            pygame.mixer.init()
+            pygame.mixer.music.load(config.MUSIC_PATH)
+            pygame.mixer.music.play(-1)  # -1 = infinite loop
+        except pygame.error as e:
+            # No audio device or music file - keep playing without music
+            log.warning("Background music not started: %s", e)
 
     def update(self, delta):
         """Update game logic"""
         if self.game_over or self.victory:
+            self._hold_positions()
             return
 
         # Handle level transition
         if self.level_complete:
+            self._hold_positions()
             self.transition_timer += delta
             if self.transition_timer >= 2.0:  # Wait 2 seconds before next level
                 if self.current_level >= 10:
                     # All levels complete - victory!
                     self.victory = True
                 else:
-                    # Advance to next level
-                    self.current_level += 1
-                    self.level_complete = False
-                    self.transition_timer = 0
-                    self.show()  # Reinitialize with new level
+                    # Advance to next level (systems, font and music stay)
+                    self.load_level(self.current_level + 1)
             return
 
+        profiler = self.profiler
+        profiler.begin()
+
+        # Stream level chunks around the camera
+        self.level.stream_chunks(self.camera.position)
+        profiler.lap("streaming")
+
+        # Wake the enemies near the camera; the rest sleep for this step
+        enemies = self.level.get_enemy_manager()
+        enemies.update_activation(self.camera.position, config.ENEMY_ACTIVATION_MARGIN)
+
+        # Remember where everything was for render interpolation
+        self.player.save_previous_position()
+        enemies.save_previous_positions()
+        profiler.lap("activation")
+
         # Handle input
         self.input_system.update(delta)
+        profiler.lap("input")
 
         # Update player
         self.player.update(delta)
+        profiler.lap("player")
 
-        # Update enemies
-        for enemy in self.level.get_enemies():
-            enemy.update(delta)
+        # Update enemies (all active ones at once)
+        enemies.update(delta)
+        profiler.lap("enemies")
 
         # Apply physics
         self.physics_system.update(delta, self.player)
-        for enemy in self.level.get_enemies():
-            self.physics_system.update(delta, enemy)
+        self.physics_system.update_batch(delta, enemies.vy, enemies.active)
+        profiler.lap("physics")
 
         # Check collisions
         self.collision_system.update(delta)
+        profiler.lap("collision")
 
         # Update camera
         self.camera.update(delta)
+        profiler.lap("camera")
 
         # Update particle system
         self.particle_system.update(delta)
+        profiler.lap("particles")
 
         # Check win/lose conditions
         self._check_game_state()
+        profiler.lap("game_state")
+
+    def _hold_positions(self):
+        """Keep player, enemies and camera still for render interpolation
+
+        Called instead of a simulation step (game over, victory, level
+        transition): the previous positions snap to the current ones, so
+        rendering with any alpha shows everything where it stopped instead
+        of replaying the last step's movement.
+        """
+        self.player.save_previous_position()
+        self.level.get_enemy_manager().save_previous_positions()
+        self.camera.save_previous_position()
 
     def _check_game_state(self):
         """Check if game is over or level is complete"""
@@ -130,32 +213,88 @@ class GameScreen(BaseScreen):
 
         # Check if player is dead - respawn instead of game over
         if self.player.get_lives() <= 0:
-            # Respawn: reload the current level
-            self.show()  # This resets the entire level
+            self._respawn()
+
+    def _respawn(self):
+        """Restart the current level in place (no new world, no reloading)"""
+        self.level.reset()
+        self.particle_system.clear()
+        self.camera.reset()
+
+    def render(self, surface, alpha=1.0):
+        """Render the game screen
+
+        Args:
+            surface: Pygame surface to render to
+            alpha: Interpolation factor between the last two simulation steps
+        """
+        profiler = self.profiler
+        profiler.begin()
 
-    def render(self, surface):
-        """Render the game screen"""
         # Draw background image
         surface.blit(self.background, (0, 0))
+        profiler.lap("render_background")
 
         # Get camera offset
-        camera_offset = self.camera.get_offset()
+        camera_offset = self.camera.get_interpolated_offset(alpha)
 
-        # Render level (blocks and goal)
-        self.level.render(surface, camera_offset)
+        # Start culling for this frame (everything outside the window is skipped)
+        culler = self.culler
+        culler.begin_frame(camera_offset, config.WINDOW_WIDTH, config.WINDOW_HEIGHT)
 
-        # Render enemies
-        for enemy in self.level.get_enemies():
+        # Render level (blocks and goal)
+        self.level.render(surface, camera_offset, culler)
+        profiler.lap("render_level")
+
+        # Render enemies (the broad phase finds the visible ones, so the cost
+        # does not grow with the number of enemies in the level)
+        self.level.get_enemy_manager().interpolate(alpha)
+        visible_enemies = self.level.get_enemies_in_range(culler.view)
+        culler.record(len(visible_enemies), len(self.level.get_enemies()) - len(visible_enemies))
+        for enemy in visible_enemies:
             enemy.render(surface, camera_offset)
+        profiler.lap("render_enemies")
 
         # Render player
+        self.player.interpolate(alpha)
         self.player.render(surface, camera_offset)
+        profiler.lap("render_player")
 
         # Render particles
-        self.particle_system.render(surface, camera_offset)
+        self.particle_system.render(surface, camera_offset, culler)
+        profiler.lap("render_particles")
 
         # Render UI
         self._render_ui(surface)
+        profiler.lap("render_ui")
+
+        # Render profiler overlay (only while visible)
+        if self.profiler_overlay.visible:
+            self.profiler_overlay.record_frame()
+            self.profiler_overlay.render(surface, [
+                f"Drawn {culler.drawn_count}  culled {culler.culled_count}",
+                f"Particles {self.particle_system.get_particle_count()}",
+                f"Enemies active {self.get_active_enemy_count()}/{len(self.level.get_enemies())}",
+            ])
+
+    def toggle_profiler_overlay(self):
+        """Show or hide the profiler overlay
+
+        Timings are only collected while the overlay is visible.
+        """
+        self.profiler_overlay.toggle()
+        if self.profiler_overlay.visible:
+            self.profiler = self.profiler_overlay.profiler
+        else:
+            self.profiler = NullProfiler()
+
+    def get_culled_count(self):
+        """Get the number of objects culled in the last rendered frame"""
+        return self.culler.culled_count
+
+    def get_active_enemy_count(self):
+        """Get the number of enemies simulated in the last update (awake and alive)"""
+        return self.level.get_enemy_manager().get_active_count()
 
     def _render_ui(self, surface):
         """Render UI elements (lives, game over, etc.)"""
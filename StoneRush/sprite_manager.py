@@ -1,15 +1,42 @@
 """
 Sprite Manager for loading and managing game sprites
 """
+import json
 import pygame
 import os
+import config
+from debug_log import get_logger
+
+
+log = get_logger("assets")
+
+ASSETS_DIR = os.path.join(os.path.dirname(__file__), "assets")
+ATLAS_IMAGE = os.path.join(ASSETS_DIR, "atlas.png")
+ATLAS_MANIFEST = os.path.join(ASSETS_DIR, "atlas.json")
+
+# Every game sprite: name -> (source PNG in assets/, in-game size, opaque)
+# build_atlas.py packs them at these sizes into the atlas
+SPRITES = {
+    "player_idle": ("player_idle.png", (int(config.PLAYER_SIZE), int(config.PLAYER_SIZE)), False),
+    "player_walk": ("player_walk.png", (int(config.PLAYER_SIZE), int(config.PLAYER_SIZE)), False),
+    "block_ground": ("block_ground.png", (int(config.BLOCK_SIZE), int(config.BLOCK_SIZE)), False),
+    "block_cracked": ("block_cracked.png", (int(config.BLOCK_SIZE), int(config.BLOCK_SIZE)), False),
+    "background": ("background.png", (config.WINDOW_WIDTH, config.WINDOW_HEIGHT), True),
+}
 
 
 class SpriteManager:
-    """Manages loading and caching of sprite images"""
+    """Manages loading and caching of sprite images
+
+    Sprites come from the texture atlas built by build_atlas.py: one image
+    decoded once, handed out as subsurfaces that already have their in-game
+    size. Sprites missing from the atlas (or all of them, if there is no
+    atlas) are loaded from the loose PNGs and scaled once at load time.
+    """
 
     _instance = None
     _sprites = {}
+    _variants = {}  # (name, size, flip_x, add_color) -> derived surface
 
     def __new__(cls):
         if cls._instance is None:
@@ -22,32 +49,42 @@ class SpriteManager:
 
     def _load_sprites(self):
         """Load all sprite images"""
-        assets_path = os.path.join(os.path.dirname(__file__), "assets")
-
-        # Load player sprites
-        self._sprites["player_idle"] = pygame.image.load(
-            os.path.join(assets_path, "player_idle.png")
-        ).convert_alpha()
+        self._load_atlas()
+        for name, (filename, size, opaque) in SPRITES.items():
+            if name not in self._sprites:
+                log.warning("%s nicht im Atlas, lade %s", name, filename)
+                self._sprites[name] = self._load_loose_sprite(filename, size, opaque)
 
-        self._sprites["player_walk"] = pygame.image.load(
-            os.path.join(assets_path, "player_walk.png")
-        ).convert_alpha()
+    def _load_atlas(self):
+        """Load the atlas image and cut it into named subsurfaces"""
+        if not (os.path.exists(ATLAS_IMAGE) and os.path.exists(ATLAS_MANIFEST)):
+            log.warning("Kein Sprite-Atlas gefunden (python build_atlas.py)")
+            return
 
-        # Load block sprites
-        print("[SPRITE MANAGER] Lade Block-Sprites...")
-        block_ground_path = os.path.join(assets_path, "block_ground.png")
-        block_cracked_path = os.path.join(assets_path, "block_cracked.png")
+        with open(ATLAS_MANIFEST, encoding="utf-8") as f:
+            manifest = json.load(f)
+        atlas = pygame.image.load(ATLAS_IMAGE).convert_alpha()
+        log.debug("Atlas geladen: %s, %d Sprites", atlas.get_size(), len(manifest["sprites"]))
 
-        self._sprites["block_ground"] = pygame.image.load(block_ground_path).convert_alpha()
-        print(f"[OK] block_ground.png geladen: {self._sprites['block_ground'].get_size()}")
+        for name, entry in manifest["sprites"].items():
+            rect = pygame.Rect(entry["rect"])
+            if name in SPRITES and rect.size != SPRITES[name][1]:
+                # Built for other sizes (e.g. config changed): rebuild the atlas
+                log.warning("%s im Atlas hat %s statt %s", name, rect.size, SPRITES[name][1])
+                continue
+            sprite = atlas.subsurface(rect)
+            if entry.get("opaque"):
+                # Opaque sprites (the background) blit much faster without alpha
+                sprite = sprite.convert()
+            self._sprites[name] = sprite
 
-        self._sprites["block_cracked"] = pygame.image.load(block_cracked_path).convert_alpha()
-        print(f"[OK] block_cracked.png geladen: {self._sprites['block_cracked'].get_size()}")
-
-        # Load background
-        self._sprites["background"] = pygame.image.load(
-            os.path.join(assets_path, "background.png")
-        ).convert()
+    def _load_loose_sprite(self, filename, size, opaque):
+        """Load one sprite from its own PNG, scaled to its in-game size"""
+        image = pygame.image.load(os.path.join(ASSETS_DIR, filename))
+        image = image.convert() if opaque else image.convert_alpha()
+        if image.get_size() != size:
+            image = pygame.transform.scale(image, size)
+        return image
 
     def get_sprite(self, name):
         """Get a sprite by name"""
@@ -59,3 +96,33 @@ class SpriteManager:
         if sprite:
             return pygame.transform.flip(sprite, flip_x, flip_y)
         return None
+
+    def get_sprite_variant(self, name, size=None, flip_x=False, add_color=None):
+        """Get a scaled, flipped and/or tinted version of a sprite
+
+        Variants are built once and shared, so callers can pick them every
+        frame without copying or transforming surfaces.
+
+        Args:
+            name: Sprite name
+            size: Optional (width, height) to scale to
+            flip_x: Flip horizontally
+            add_color: Optional RGBA color added with BLEND_RGBA_ADD (e.g. flash effect)
+        """
+        key = (name, size, flip_x, add_color)
+        variant = self._variants.get(key)
+        if variant is None:
+            variant = self._sprites.get(name)
+            if variant is None:
+                return None
+
+            if size and variant.get_size() != size:
+                variant = pygame.transform.scale(variant, size)
+            if flip_x:
+                variant = pygame.transform.flip(variant, True, False)
+            if add_color:
+                variant = variant.copy()
+                variant.fill(add_color, special_flags=pygame.BLEND_RGBA_ADD)
+
+            self._variants[key] = variant
+        return variant
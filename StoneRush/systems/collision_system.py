@@ -2,16 +2,42 @@
 Collision system for AABB collision detection
 Ported from CollisionSystem.java
 """
-import pygame
-from enums import BlockType
+import math
+import numpy as np
+from entities.enemy_manager import round_like_rect
+from debug_log import get_logger
+import config
+
+
+log = get_logger("collision")
 
 
 class CollisionSystem:
-    """Handles all collision detection and resolution"""
+    """Handles all collision detection and resolution
+
+    Blocks are resolved against the level's tile grid: every solid tile
+    under the entity's surroundings that its bounds overlap pushes it out
+    along the side of least overlap (in the direction it is moving). Steps
+    longer than MAX_STEP_DISTANCE are split into sub-steps that are
+    resolved one after the other, so fast objects and long steps cannot
+    pass through walls or floors.
+    """
+
+    GROUND_TOLERANCE = 3.0  # Pixels of tolerance for ground detection
+    # Longest move resolved in one go: with less than half a block of
+    # penetration the side of least overlap is the side the entity came from
+    MAX_STEP_DISTANCE = config.BLOCK_SIZE / 2
+    # Below this many active enemies the per-enemy loop beats the NumPy batch
+    # (array setup costs more than it saves for a handful of enemies)
+    ENEMY_BATCH_MIN = 28
 
     def __init__(self, level):
         self.level = level
 
+    def set_level(self, level):
+        """Switch to another level"""
+        self.level = level
+
     def update(self, delta):
         """Update all collisions"""
         player = self.level.get_player()
@@ -25,21 +51,17 @@ class CollisionSystem:
         # Player vs Enemies
         self._handle_player_enemy_collisions(player)
 
-        # Enemies vs Blocks (for grounding)
-        for enemy in self.level.get_enemies():
-            self._handle_enemy_block_collisions(enemy)
+        # Enemies vs Blocks (for grounding), all active enemies in one batch
+        self._handle_enemy_block_collisions(self.level.get_enemy_manager())
 
     def _handle_player_boundary_collisions(self, player):
         """Handle collisions between player and level boundaries (invisible walls)"""
-        import config
-
         pos = player.get_position()
         vel = player.get_velocity()
         bounds = player.get_bounds()
 
         # Calculate level boundaries
-        level_width = config.LEVEL_WIDTH_BLOCKS * config.BLOCK_SIZE
-        level_height = config.LEVEL_HEIGHT_BLOCKS * config.BLOCK_SIZE
+        level_width = self.level.get_pixel_width()
 
         # Left boundary (x = 0)
         if pos.x < 0:
@@ -60,32 +82,58 @@ class CollisionSystem:
         player.update_bounds()
 
     def _handle_player_block_collisions(self, player):
-        """Handle collisions between player and blocks"""
-        player_bounds = player.get_bounds()
+        """Handle collisions between player and the tile grid
 
-        # Expand search area slightly
-        search_area = pygame.Rect(
-            player_bounds.x - 32,
-            player_bounds.y - 32,
-            player_bounds.width + 64,
-            player_bounds.height + 64
-        )
+        A step longer than MAX_STEP_DISTANCE is replayed in sub-steps from
+        the position at the start of the step; an axis stops moving once a
+        block stopped it.
+        """
+        pos = player.get_position()
+        prev = player.previous_position
+        dx = pos.x - prev.x
+        dy = pos.y - prev.y
+        steps = self._count_sub_steps(dx, dy)
+        if steps == 1:
+            self._resolve_player_block_collisions(player)
+            return
+
+        target_x, target_y = pos.x, pos.y
+        start_x, start_y = prev.x, prev.y
+        move_x = move_y = True
+        for step in range(1, steps + 1):
+            if move_x:
+                pos.x = target_x if step == steps else start_x + dx * step / steps
+            if move_y:
+                pos.y = target_y if step == steps else start_y + dy * step / steps
+            player.update_bounds()
+            hit_x, hit_y = self._resolve_player_block_collisions(player)
+            move_x = move_x and not hit_x
+            move_y = move_y and not hit_y
+
+    def _resolve_player_block_collisions(self, player):
+        """Resolve the player against the solid tiles around its bounds
+
+        Grounding is checked first, on the bounds before resolution, with
+        GROUND_TOLERANCE; then every overlapping tile is resolved in turn.
+
+        Returns:
+            Tuple (hit_x, hit_y): whether a tile stopped the player along x / y
+        """
+        size = int(config.BLOCK_SIZE)
+        bounds = player.get_bounds()
 
-        nearby_blocks = self.level.get_blocks_in_range(search_area)
+        # Expand search area slightly
+        cells = self.level.get_solid_cells(bounds.x - 32, bounds.y - 32,
+                                           bounds.width + 64, bounds.height + 64)
 
-        # Check if player is grounded with tolerance
-        # Instead of setting to False immediately, check if there's a block below
+        # Check if player is standing on or very close to a block top
         grounded = False
-        ground_tolerance = 3.0  # Pixels of tolerance for ground detection
-
-        # First check if player is on or very close to ground
-        for block in nearby_blocks:
-            b_bounds = block.get_bounds()
-            # Check if player is standing on top of this block (with small tolerance)
-            if (player_bounds.x + player_bounds.width > b_bounds.x and
-                player_bounds.x < b_bounds.x + b_bounds.width and
-                player_bounds.y + player_bounds.height >= b_bounds.y - ground_tolerance and
-                player_bounds.y + player_bounds.height <= b_bounds.y + ground_tolerance):
+        feet = bounds.y + bounds.height
+        for col, row in cells:
+            block_x = col * size
+            block_y = row * size
+            if (bounds.x + bounds.width > block_x and bounds.x < block_x + size and
+                    block_y - self.GROUND_TOLERANCE <= feet <= block_y + self.GROUND_TOLERANCE):
                 grounded = True
                 break
 
@@ -93,157 +141,318 @@ class CollisionSystem:
         old_grounded = player.is_grounded
         player.set_grounded(grounded)
         if old_grounded != grounded:
-            print(f"Grounded changed: {old_grounded} -> {grounded}")
-
-        # Now handle collisions
-        for block in nearby_blocks:
-            player_bounds = player.get_bounds()  # Refresh bounds after each collision
-            if player_bounds.colliderect(block.get_bounds()):
-                self._resolve_player_block_collision(player, block)
-
-    def _resolve_player_block_collision(self, player, block):
-        """Resolve collision between player and block using AABB"""
-        p_bounds = player.get_bounds()
-        b_bounds = block.get_bounds()
-
-        # Calculate overlap on each side
-        overlap_left = (p_bounds.x + p_bounds.width) - b_bounds.x
-        overlap_right = (b_bounds.x + b_bounds.width) - p_bounds.x
-        overlap_top = (p_bounds.y + p_bounds.height) - b_bounds.y
-        overlap_bottom = (b_bounds.y + b_bounds.height) - p_bounds.y
-
-        # Find minimum overlap
+            log.debug("Grounded changed: %s -> %s", old_grounded, grounded)
+
+        # Now handle collisions (update_bounds keeps bounds current)
+        hit_x = hit_y = False
+        for col, row in cells:
+            block_x = col * size
+            block_y = row * size
+            if not (bounds.x + bounds.width > block_x and bounds.x < block_x + size and
+                    bounds.y + bounds.height > block_y and bounds.y < block_y + size):
+                continue
+            side = self._resolve_block_overlap(player, bounds, block_x, block_y, size)
+            if side in ("left", "right"):
+                hit_x = True
+                # If ramming, destroy cracked blocks or stop dash
+                if player.is_ramming():
+                    if self.level.get_tile_type(col, row).destructible:
+                        self.level.destroy_tile(col, row)
+                    # Stop dash immediately when hitting any block while dashing
+                    player.stop_ram()
+            elif side is not None:
+                hit_y = True
+        return hit_x, hit_y
+
+    def _resolve_block_overlap(self, player, bounds, block_x, block_y, size):
+        """Push the player out of one block along the side of least overlap
+
+        Returns:
+            Side of the block the player was pushed to ("top", "bottom",
+            "left", "right"), or None if it is moving away from that side
+        """
+        overlap_left = (bounds.x + bounds.width) - block_x
+        overlap_right = (block_x + size) - bounds.x
+        overlap_top = (bounds.y + bounds.height) - block_y
+        overlap_bottom = (block_y + size) - bounds.y
         min_overlap = min(overlap_left, overlap_right, overlap_top, overlap_bottom)
 
         pos = player.get_position()
         vel = player.get_velocity()
-
-        if min_overlap == overlap_top and vel.y >= 0:  # Changed > to >= for better ground detection
-            # Collision from top (player landing on block from above)
-            # In Pygame: positive y velocity = falling down
-            pos.y = b_bounds.y - p_bounds.height
-            vel.y = 0  # Stop all downward movement
+        if min_overlap == overlap_top and vel.y >= 0:
+            # Landing on top of a block (positive y = falling down)
+            pos.y = block_y - bounds.height
+            vel.y = 0
             player.set_grounded(True)
-            player.update_bounds()  # Update immediately
+            side = "top"
         elif min_overlap == overlap_bottom and vel.y < 0:
-            # Collision from bottom (player hitting head while jumping)
-            # In Pygame: negative y velocity = going up
-            pos.y = b_bounds.y + b_bounds.height
+            # Hitting the head while jumping
+            pos.y = block_y + size
             vel.y = 0
-            player.update_bounds()  # Update immediately
+            side = "bottom"
         elif min_overlap == overlap_left and vel.x > 0:
-            # Collision from left
-            pos.x = b_bounds.x - p_bounds.width
+            pos.x = block_x - bounds.width
             vel.x = 0
-            player.update_bounds()  # Update immediately
-
-            # If ramming, destroy cracked blocks or stop dash
-            if player.is_ramming():
-                if block.get_type() == BlockType.CRACKED:
-                    block.destroy()
-                # Stop dash immediately when hitting any block while dashing
-                player.stop_ram()
-
+            side = "left"
         elif min_overlap == overlap_right and vel.x < 0:
-            # Collision from right
-            pos.x = b_bounds.x + b_bounds.width
+            pos.x = block_x + size
             vel.x = 0
-            player.update_bounds()  # Update immediately
-
-            # If ramming, destroy cracked blocks or stop dash
-            if player.is_ramming():
-                if block.get_type() == BlockType.CRACKED:
-                    block.destroy()
-                # Stop dash immediately when hitting any block while dashing
-                player.stop_ram()
+            side = "right"
+        else:
+            return None
+        player.update_bounds()
+        return side
 
     def _handle_player_enemy_collisions(self, player):
         """Handle collisions between player and enemies"""
-        player_bounds = player.get_bounds()
-
-        for enemy in self.level.get_enemies():
-            if enemy.is_dead:
-                continue
+        killed = False
 
-            if player_bounds.colliderect(enemy.get_bounds()):
-                if player.is_ramming():
-                    # Destroy enemy
-                    enemy.die()
-                else:
-                    # Player takes damage
-                    player.take_damage()
-
-        # Clean up dead enemies
-        self.level.remove_dead_enemies()
-
-    def _handle_enemy_block_collisions(self, enemy):
-        """Handle collisions between enemy and blocks (for grounding)"""
-        enemy_bounds = enemy.get_bounds()
-
-        search_area = pygame.Rect(
-            enemy_bounds.x - 16,
-            enemy_bounds.y - 16,
-            enemy_bounds.width + 32,
-            enemy_bounds.height + 32
-        )
-
-        nearby_blocks = self.level.get_blocks_in_range(search_area)
-
-        # Check for platform edge (prevent falling)
-        vel = enemy.get_velocity()
-        if abs(vel.x) > 0:  # Only check if enemy is moving
-            # Calculate position slightly ahead of enemy in movement direction
-            check_distance = enemy_bounds.width  # Check one body width ahead
-            check_x = enemy_bounds.x + check_distance if vel.x > 0 else enemy_bounds.x - check_distance
-            check_y = enemy_bounds.y + enemy_bounds.height + 5  # Check just below feet
-
-            # Check if there's ground ahead
-            has_ground_ahead = False
-            for block in nearby_blocks:
-                b_bounds = block.get_bounds()
-                # Check if there's a block below the position ahead
-                if (check_x >= b_bounds.x and check_x <= b_bounds.x + b_bounds.width and
-                    check_y >= b_bounds.y and check_y <= b_bounds.y + b_bounds.height):
-                    has_ground_ahead = True
+        # Broad phase: only enemies near the player along x are tested
+        for enemy in self.level.get_enemies_in_range(player.get_bounds()):
+            if player.is_ramming():
+                # Destroy enemy
+                enemy.die()
+                killed = True
+            else:
+                # Player takes damage
+                player.take_damage()
+
+        # Clean up dead enemies (only when one actually died)
+        if killed:
+            self.level.remove_dead_enemies()
+
+    def _handle_enemy_block_collisions(self, enemies):
+        """Handle collisions between all active enemies and the tile grid
+
+        Enemies turn at ledges and walls and land on floors. With many active
+        enemies this runs as array operations on the EnemyManager's state,
+        with few of them one enemy at a time (same results). Sleeping enemies
+        did not move, so they are skipped.
+        """
+        active = enemies.get_active_indices()
+        if active.size == 0:
+            return
+        if active.size < self.ENEMY_BATCH_MIN:
+            for index in active.tolist():
+                self._handle_enemy_block_collision(enemies, index)
+            return
+
+        size = config.BLOCK_SIZE
+        width = enemies.WIDTH
+        height = enemies.HEIGHT
+        x = enemies.x[active]
+        y = enemies.y[active]
+        vx = enemies.vx[active]
+        vy = enemies.vy[active]
+
+        # Solid tiles under the search area (bounds grown by 16 px): at most
+        # 3 x 3 cells, visited column by column and bottom to top like the
+        # scalar version
+        left = round_like_rect(x)
+        top = round_like_rect(y)
+        first_col = np.floor((left - 16) / size)
+        last_col = np.floor((left + width + 15) / size)
+        first_row = np.floor((top - 16) / size)
+        last_row = np.floor((top + height + 15) / size)
+        offsets = np.arange(3.0)
+        cols = first_col[:, None] + offsets
+        rows = last_row[:, None] - offsets
+        solid = self.level.are_solid_tiles(cols[:, :, None], rows[:, None, :])
+        solid &= (cols <= last_col[:, None])[:, :, None] & (rows >= first_row[:, None])[:, None, :]
+
+        # Check for platform edge (prevent falling): a point one body width
+        # ahead and just below the feet must be in one of those tiles (edges
+        # included)
+        check_x = np.where(vx > 0, left + width, left - width)
+        check_y = top + height + 5
+        in_col = (cols * size <= check_x[:, None]) & (check_x[:, None] <= cols * size + size)
+        in_row = (rows * size <= check_y[:, None]) & (check_y[:, None] <= rows * size + size)
+        turn = (vx != 0) & ~(solid & in_col[:, :, None] & in_row[:, None, :]).any(axis=(1, 2))
+        vx[turn] = -vx[turn]
+
+        # Enemies that moved too far for one resolution take the scalar sub-steps
+        prev_x = enemies.previous_x[active]
+        prev_y = enemies.previous_y[active]
+        steps = self._count_sub_steps_batch(x - prev_x, y - prev_y)
+        long_step = steps > 1
+        if long_step.any():
+            for i in np.flatnonzero(long_step).tolist():
+                enemies.x[active[i]], enemies.y[active[i]], enemies.vx[active[i]], enemies.vy[active[i]] = \
+                    self._resolve_enemy_sub_steps(enemies, float(prev_x[i]), float(prev_y[i]), float(x[i]),
+                                                  float(y[i]), float(vx[i]), float(vy[i]), int(steps[i]))
+            keep = ~long_step
+            active, x, y, vx, vy = active[keep], x[keep], y[keep], vx[keep], vy[keep]
+            left, top, cols, rows, solid = left[keep], top[keep], cols[keep], rows[keep], solid[keep]
+
+        for col_offset in range(3):
+            block_x = cols[:, col_offset] * size
+            for row_offset in range(3):
+                candidates = solid[:, col_offset, row_offset]
+                if not candidates.any():
+                    continue
+                block_y = rows[:, row_offset] * size
+                overlap_left = left + width - block_x
+                overlap_right = block_x + size - left
+                overlap_top = top + height - block_y
+                overlap_bottom = block_y + size - top
+                colliding = (candidates & (overlap_left > 0) & (overlap_right > 0) &
+                             (overlap_top > 0) & (overlap_bottom > 0))
+                if not colliding.any():
+                    continue
+                min_overlap = np.minimum(np.minimum(overlap_left, overlap_right),
+                                         np.minimum(overlap_top, overlap_bottom))
+
+                # Ground collision - enemies landing on top of blocks
+                land = colliding & (min_overlap == overlap_top) & (vy > 0)
+                # Side collisions - reverse direction for patrolling
+                colliding &= ~land
+                hit_left = colliding & (min_overlap == overlap_left) & (vx > 0)
+                hit_right = colliding & ~hit_left & (min_overlap == overlap_right) & (vx < 0)
+                y[land] = block_y[land] - height
+                vy[land] = 0.0
+                x[hit_left] = block_x[hit_left] - width
+                x[hit_right] = block_x[hit_right] + size
+                turned = hit_left | hit_right
+                vx[turned] = -vx[turned]
+                left = round_like_rect(x)
+                top = round_like_rect(y)
+
+        enemies.x[active] = x
+        enemies.y[active] = y
+        enemies.vx[active] = vx
+        enemies.vy[active] = vy
+
+    def _handle_enemy_block_collision(self, enemies, index):
+        """Handle collisions between one enemy and the tile grid
+
+        Scalar version of the batch in _handle_enemy_block_collisions.
+        """
+        size = int(config.BLOCK_SIZE)
+        x = float(enemies.x[index])
+        y = float(enemies.y[index])
+        vx = float(enemies.vx[index])
+        vy = float(enemies.vy[index])
+        left = _round_like_rect(x)
+        top = _round_like_rect(y)
+        cells = self._get_enemy_search_cells(left, top, enemies)
+
+        # Check for platform edge (prevent falling): a point one body width
+        # ahead and just below the feet must be in a solid tile of the search
+        # area (edges included)
+        if vx != 0:
+            check_x = left + enemies.WIDTH if vx > 0 else left - enemies.WIDTH
+            check_y = top + enemies.HEIGHT + 5
+            for col, row in cells:
+                if (col * size <= check_x <= col * size + size and
+                        row * size <= check_y <= row * size + size):
                     break
-
-            # If no ground ahead, turn around
-            if not has_ground_ahead:
-                vel.x = -vel.x
-
-        for block in nearby_blocks:
-            if enemy_bounds.colliderect(block.get_bounds()):
-                self._resolve_enemy_block_collision(enemy, block)
-
-    def _resolve_enemy_block_collision(self, enemy, block):
-        """Resolve collision between enemy and block (simple ground collision)"""
-        e_bounds = enemy.get_bounds()
-        b_bounds = block.get_bounds()
-
-        # Calculate overlap on each side
-        overlap_left = (e_bounds.x + e_bounds.width) - b_bounds.x
-        overlap_right = (b_bounds.x + b_bounds.width) - e_bounds.x
-        overlap_top = (e_bounds.y + e_bounds.height) - b_bounds.y
-        overlap_bottom = (b_bounds.y + b_bounds.height) - e_bounds.y
-
-        # Find minimum overlap
-        min_overlap = min(overlap_left, overlap_right, overlap_top, overlap_bottom)
-
-        vel = enemy.get_velocity()
-        pos = enemy.get_position()
-
-        # Ground collision - enemy landing on top of block
-        if min_overlap == overlap_top and vel.y > 0:
-            # In Pygame: positive y velocity = falling down
-            pos.y = b_bounds.y - e_bounds.height
-            vel.y = 0
-            enemy.update_bounds()
-        # Side collisions - reverse direction for patrolling
-        elif min_overlap == overlap_left and vel.x > 0:
-            pos.x = b_bounds.x - e_bounds.width
-            vel.x = -vel.x  # Reverse direction
-            enemy.update_bounds()
-        elif min_overlap == overlap_right and vel.x < 0:
-            pos.x = b_bounds.x + b_bounds.width
-            vel.x = -vel.x  # Reverse direction
-            enemy.update_bounds()
+            else:
+                vx = -vx
+
+        prev_x = float(enemies.previous_x[index])
+        prev_y = float(enemies.previous_y[index])
+        steps = self._count_sub_steps(x - prev_x, y - prev_y)
+        if steps == 1:
+            x, y, vx, vy, _, _ = self._resolve_enemy_block_collisions(enemies, x, y, vx, vy, cells)
+        else:
+            x, y, vx, vy = self._resolve_enemy_sub_steps(enemies, prev_x, prev_y, x, y, vx, vy, steps)
+        enemies.x[index] = x
+        enemies.y[index] = y
+        enemies.vx[index] = vx
+        enemies.vy[index] = vy
+
+    def _resolve_enemy_sub_steps(self, enemies, prev_x, prev_y, x, y, vx, vy, steps):
+        """Resolve an enemy's long step in sub-steps from its previous position
+
+        Returns:
+            Tuple (x, y, vx, vy) after the step
+        """
+        target_x, target_y = x, y
+        dx = target_x - prev_x
+        dy = target_y - prev_y
+        move_x = move_y = True
+        for step in range(1, steps + 1):
+            if move_x:
+                x = target_x if step == steps else prev_x + dx * step / steps
+            if move_y:
+                y = target_y if step == steps else prev_y + dy * step / steps
+            x, y, vx, vy, hit_x, hit_y = self._resolve_enemy_block_collisions(enemies, x, y, vx, vy)
+            move_x = move_x and not hit_x
+            move_y = move_y and not hit_y
+        return x, y, vx, vy
+
+    def _resolve_enemy_block_collisions(self, enemies, x, y, vx, vy, cells=None):
+        """Resolve one enemy against the solid tiles around its bounds
+
+        Enemies land on block tops and turn around at block sides.
+
+        Args:
+            enemies: EnemyManager (for the enemy size)
+            x, y: Position
+            vx, vy: Velocity
+            cells: Solid tiles around the enemy's current bounds, if already known
+
+        Returns:
+            Tuple (x, y, vx, vy, hit_x, hit_y): the resolved state and whether
+            a tile stopped the enemy along x / y
+        """
+        size = int(config.BLOCK_SIZE)
+        width = int(enemies.WIDTH)
+        height = int(enemies.HEIGHT)
+        left = _round_like_rect(x)
+        top = _round_like_rect(y)
+        if cells is None:
+            cells = self._get_enemy_search_cells(left, top, enemies)
+
+        hit_x = hit_y = False
+        for col, row in cells:
+            block_x = col * size
+            block_y = row * size
+            overlap_left = (left + width) - block_x
+            overlap_right = (block_x + size) - left
+            overlap_top = (top + height) - block_y
+            overlap_bottom = (block_y + size) - top
+            min_overlap = min(overlap_left, overlap_right, overlap_top, overlap_bottom)
+            if min_overlap <= 0:
+                continue  # Not colliding
+
+            if min_overlap == overlap_top and vy > 0:
+                # Ground collision - enemy landing on top of block
+                y = block_y - height
+                vy = 0.0
+                hit_y = True
+            elif min_overlap == overlap_left and vx > 0:
+                # Side collisions - reverse direction for patrolling
+                x = block_x - width
+                vx = -vx
+                hit_x = True
+            elif min_overlap == overlap_right and vx < 0:
+                x = block_x + size
+                vx = -vx
+                hit_x = True
+            else:
+                continue
+            left = _round_like_rect(x)
+            top = _round_like_rect(y)
+        return x, y, vx, vy, hit_x, hit_y
+
+    def _get_enemy_search_cells(self, left, top, enemies):
+        """Get the solid tiles under an enemy's integer bounds grown by 16 px"""
+        return self.level.get_solid_cells(left - 16, top - 16,
+                                          int(enemies.WIDTH) + 32, int(enemies.HEIGHT) + 32)
+
+    def _count_sub_steps(self, dx, dy):
+        """Number of sub-steps for a move, each at most MAX_STEP_DISTANCE long (at least 1)"""
+        distance = max(abs(dx), abs(dy))
+        if distance <= self.MAX_STEP_DISTANCE:
+            return 1
+        return math.ceil(distance / self.MAX_STEP_DISTANCE)
+
+    def _count_sub_steps_batch(self, dx, dy):
+        """Batched _count_sub_steps for arrays of moves"""
+        return np.maximum(np.ceil(np.maximum(np.abs(dx), np.abs(dy)) / self.MAX_STEP_DISTANCE), 1)
+
+
+def _round_like_rect(value):
+    """Round one pixel position to an int the way pygame.Rect does (half away from zero)"""
+    return math.trunc(value + math.copysign(0.5, value))
@@ -2,33 +2,88 @@
 Input system for keyboard handling
 Ported from InputSystem.java
 """
+from collections import namedtuple
 import pygame
 
 
+# Player controls for one frame
+InputState = namedtuple("InputState", ["left", "right", "jump", "ram"],
+                        defaults=(False, False, False, False))
+
+
+class KeyboardInput:
+    """Input source that reads the real keyboard"""
+
+    def poll(self):
+        """Get the current controls from the keyboard"""
+        keys = pygame.key.get_pressed()
+        return InputState(
+            left=keys[pygame.K_LEFT],
+            right=keys[pygame.K_RIGHT],
+            jump=keys[pygame.K_SPACE] or keys[pygame.K_UP],  # Space OR Up Arrow
+            ram=keys[pygame.K_LSHIFT] or keys[pygame.K_RSHIFT]
+        )
+
+
+class ScriptedInput:
+    """Input source that replays a fixed script (headless runs, benchmarks)
+
+    The script is a list of (frame_count, InputState) segments. Each poll()
+    advances one frame; the script loops when it reaches the end.
+    """
+
+    def __init__(self, script, loop=True):
+        self.frames = []
+        for frame_count, state in script:
+            self.frames.extend([state] * frame_count)
+        self.loop = loop
+        self.frame = 0
+
+    def poll(self):
+        """Get the controls for the next frame"""
+        if self.frame >= len(self.frames):
+            if not self.loop or not self.frames:
+                return InputState()
+            self.frame = 0
+
+        state = self.frames[self.frame]
+        self.frame += 1
+        return state
+
+    def reset(self):
+        """Restart the script from the first frame"""
+        self.frame = 0
+
+
 class InputSystem:
     """Handles keyboard input for player control"""
 
-    def __init__(self, player):
+    def __init__(self, player, input_source=None):
+        self.player = player
+        self.input_source = input_source or KeyboardInput()
+
+    def set_player(self, player):
+        """Control another player (after a level change)"""
         self.player = player
 
     def update(self, delta):
         """Process keyboard input"""
-        keys = pygame.key.get_pressed()
+        controls = self.input_source.poll()
 
         # Horizontal movement
-        if keys[pygame.K_LEFT]:
+        if controls.left:
             self.player.move_left()
-        elif keys[pygame.K_RIGHT]:
+        elif controls.right:
             self.player.move_right()
         else:
             self.player.stop_horizontal_movement()
 
-        # Jump (Space OR Up Arrow)
-        if keys[pygame.K_SPACE] or keys[pygame.K_UP]:
+        # Jump
+        if controls.jump:
             self.player.jump()
 
         # Ram (Shift) - continuous while held
-        if keys[pygame.K_LSHIFT] or keys[pygame.K_RSHIFT]:
+        if controls.ram:
             self.player.start_ram()
             # Keep ramming while shift is held
             self.player.keep_ramming()
@@ -2,12 +2,15 @@
 Physics system for gravity and velocity
 Ported from PhysicsSystem.java
 """
+import numpy as np
 import config
 
 
 class PhysicsSystem:
     """Applies physics (gravity) to game objects"""
 
+    TERMINAL_VELOCITY = 1000.0
+
     def update(self, delta, game_object):
         """Apply physics to a game object
 
@@ -19,5 +22,17 @@ class PhysicsSystem:
         game_object.velocity.y += config.GRAVITY * delta
 
         # Terminal velocity (in Pygame, positive y = falling down)
-        if game_object.velocity.y > 1000.0:
-            game_object.velocity.y = 1000.0
+        if game_object.velocity.y > self.TERMINAL_VELOCITY:
+            game_object.velocity.y = self.TERMINAL_VELOCITY
+
+    def update_batch(self, delta, velocity_y, mask):
+        """Apply physics to many objects stored as NumPy arrays
+
+        Args:
+            delta: Time delta in seconds
+            velocity_y: Array of y velocities (modified in place)
+            mask: Bool array selecting the objects to update
+        """
+        velocity = velocity_y[mask] + config.GRAVITY * delta
+        np.minimum(velocity, self.TERMINAL_VELOCITY, out=velocity)
+        velocity_y[mask] = velocity
@@ -0,0 +1,83 @@
+"""
+Collision regression tests
+Replays scripted input headless and compares the player against traces
+recorded before collision moved to the tile grid.
+
+Usage:
+    python -m unittest tests.test_collision      # From the StoneRush directory
+"""
+import unittest
+import headless
+from systems.input_system import InputState
+
+
+# Level 1: jump at x=272 towards the platform at x=320 (top at y=448). The
+# player rises against its left side and steps onto the ledge once the feet
+# are within GROUND_TOLERANCE of the top, instead of being pinned at x=288.
+LEDGE_TRACE = [
+    (275.333, 505.333, "JUMPING"),
+    (278.667, 498.889, "JUMPING"),
+    (282.0, 492.667, "JUMPING"),
+    (285.333, 486.667, "JUMPING"),
+    (288.667, 480.889, "JUMPING"),
+    (288.0, 475.333, "JUMPING"),
+    (288.0, 470.0, "JUMPING"),
+    (288.0, 464.889, "JUMPING"),
+    (288.0, 460.0, "JUMPING"),
+    (288.0, 455.333, "JUMPING"),
+    (288.0, 450.889, "JUMPING"),
+    (288.0, 446.667, "JUMPING"),
+    (288.0, 442.667, "JUMPING"),
+    (288.0, 438.889, "JUMPING"),
+    (288.0, 435.333, "JUMPING"),
+    (288.0, 432.0, "JUMPING"),
+    (288.0, 428.889, "JUMPING"),
+    (288.0, 426.0, "JUMPING"),
+    (288.0, 423.333, "JUMPING"),
+    (288.0, 420.889, "JUMPING"),
+    (288.0, 418.667, "JUMPING"),
+    (291.333, 416.667, "WALKING"),
+    (294.667, 414.889, "WALKING"),
+    (298.0, 413.333, "WALKING"),
+]
+
+
+class PlayerBlockCollisionTest(unittest.TestCase):
+    """Player against the tile grid"""
+
+    @classmethod
+    def setUpClass(cls):
+        headless.init_headless()
+
+    def create_screen(self, script, x, y):
+        """Create a level 1 GameScreen with the player standing at (x, y)"""
+        screen = headless.create_game_screen(1, script)
+        player = screen.level.get_player()
+        player.reset_position(x, y)
+        player.set_grounded(True)
+        return screen, player
+
+    def test_rising_player_steps_onto_ledge(self):
+        script = [(1, InputState(right=True, jump=True)), (40, InputState(right=True))]
+        screen, player = self.create_screen(script, 272.0, 512.0)
+
+        trace = []
+        for _ in LEDGE_TRACE:
+            screen.update(1 / 60)
+            trace.append((round(player.position.x, 3), round(player.position.y, 3), player.state.name))
+        self.assertEqual(trace, LEDGE_TRACE)
+
+    def test_long_step_does_not_tunnel(self):
+        # One 1/4 s step of a fast fall moves the player far past the
+        # one-block-thick ground under x=64 (top at y=544)
+        screen, player = self.create_screen([(1, InputState())], 64.0, 0.0)
+        player.set_grounded(False)
+        player.get_velocity().y = 3000.0
+
+        screen.update(0.25)
+        self.assertEqual(player.position.y, 512.0)
+        self.assertTrue(player.is_grounded)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+"""
+Broad phase for entity-vs-entity checks
+Sort-and-sweep along the x axis
+"""
+import numpy as np
+
+
+class BroadPhase:
+    """Keeps boxes sorted by x and finds the ones overlapping an area
+
+    The boxes live in NumPy arrays owned by someone else (e.g. the
+    EnemyManager); the broad phase only keeps the indices taking part,
+    sorted by left edge. Objects only move a few pixels per step, so the
+    order is only re-sorted when two of them swapped places. A query
+    searches the sorted edges and narrow-phases only the boxes whose x
+    interval can reach the area, instead of testing every box.
+    """
+
+    def __init__(self):
+        self.order = np.empty(0, dtype=np.intp)  # Indices sorted by left edge
+
+    def set_indices(self, indices):
+        """Replace the indices taking part (e.g. after enemies died or respawned)"""
+        self.order = np.asarray(indices, dtype=np.intp)
+
+    def query(self, area, left, top, width, height):
+        """Get the boxes that overlap the area
+
+        Args:
+            area: pygame.Rect to test against
+            left: Array of left edges of all boxes
+            top: Array of top edges of all boxes
+            width: Box width (same for all boxes)
+            height: Box height (same for all boxes)
+
+        Returns:
+            Array of indices of the overlapping boxes, ordered by x
+        """
+        order = self.order
+        lefts = left[order]
+
+        # The order rarely changes between steps: only re-sort when it did
+        if lefts.size > 1 and (lefts[1:] < lefts[:-1]).any():
+            by_left = np.argsort(lefts, kind="stable")
+            self.order = order = order[by_left]
+            lefts = lefts[by_left]
+
+        # Only boxes starting left of area.right and close enough to reach area.left
+        first = np.searchsorted(lefts, area.left - width, side="right")
+        last = np.searchsorted(lefts, area.right, side="left")
+        window = order[first:last]
+
+        # Narrow phase (same test as pygame.Rect.colliderect)
+        window_top = top[window]
+        overlap = ((left[window] + width > area.left)
+                   & (window_top < area.bottom) & (window_top + height > area.top))
+        return window[overlap]
+
+    def __len__(self):
+        return len(self.order)
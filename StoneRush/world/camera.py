@@ -12,12 +12,32 @@ class Camera:
     def __init__(self, player):
         self.player = player
         self.position = pygame.Vector2(0, 0)
+        self.previous_position = pygame.Vector2(0, 0)
         self.lerp_speed = 0.1  # Smooth follow speed
         self.offset_x = 200  # Keep player left of center
 
-        # Level bounds
-        self.level_width = config.LEVEL_WIDTH_BLOCKS * config.BLOCK_SIZE
-        self.level_height = config.LEVEL_HEIGHT_BLOCKS * config.BLOCK_SIZE
+        # Level bounds (set per level with set_level_size)
+        self.level_width = config.WINDOW_WIDTH
+        self.level_height = config.WINDOW_HEIGHT
+
+    def set_level_size(self, width, height):
+        """Set the level size in pixels the camera is clamped to"""
+        self.level_width = width
+        self.level_height = height
+
+    def set_target(self, player):
+        """Follow another player and jump back to the start of the level"""
+        self.player = player
+        self.reset()
+
+    def reset(self):
+        """Jump back to the start of the level"""
+        self.position.update(0, 0)
+        self.previous_position.update(0, 0)
+
+    def save_previous_position(self):
+        """Remember the current position as the start of the next interpolation"""
+        self.previous_position.update(self.position)
 
     def update(self, delta):
         """Update camera position to follow player smoothly"""
@@ -25,9 +45,13 @@ class Camera:
         target_x = self.player.position.x - self.offset_x
         target_y = self.player.position.y - config.WINDOW_HEIGHT / 2
 
-        # Lerp towards target (smooth follow)
-        self.position.x += (target_x - self.position.x) * self.lerp_speed
-        self.position.y += (target_y - self.position.y) * self.lerp_speed
+        # Lerp towards target (smooth follow). lerp_speed is the fraction per
+        # frame at TARGET_FPS; scale it so the follow speed doesn't depend on
+        # the simulation rate
+        self.save_previous_position()
+        factor = 1.0 - (1.0 - self.lerp_speed) ** (delta * config.TARGET_FPS)
+        self.position.x += (target_x - self.position.x) * factor
+        self.position.y += (target_y - self.position.y) * factor
 
         # Clamp camera to level bounds
         # Don't go past left edge
@@ -51,3 +75,13 @@ class Camera:
     def get_offset(self):
         """Get camera offset as tuple (x, y)"""
         return (self.position.x, self.position.y)
+
+    def get_interpolated_offset(self, alpha):
+        """Get camera offset between the previous and the current update
+
+        Args:
+            alpha: 0.0 = previous update, 1.0 = current update
+        """
+        previous = self.previous_position
+        return (previous.x + (self.position.x - previous.x) * alpha,
+                previous.y + (self.position.y - previous.y) * alpha)
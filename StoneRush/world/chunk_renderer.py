@@ -0,0 +1,129 @@
+"""
+Chunked terrain rendering
+Bakes static tiles into cached chunk surfaces
+"""
+import math
+import numpy as np
+import pygame
+from entities.block import TILE_TYPES
+from world.level_data import BLOCK_TYPES
+import config
+
+
+# Tile code -> TileType flyweight
+_TILE_TYPES_BY_CODE = tuple(TILE_TYPES[block_type] for block_type in BLOCK_TYPES)
+
+
+class ChunkRenderer:
+    """Renders level terrain from pre-baked chunk surfaces
+
+    Tiles never move, so every CHUNK_TILES x CHUNK_TILES group of tiles is
+    drawn once into its own surface, straight from the tile codes with the
+    shared TileType sprites. Rendering then only blits the chunks the camera
+    can see. A chunk is re-baked when one of its tiles changes. Columns are
+    added and removed as the level streams in and out.
+    """
+
+    CHUNK_TILES = config.CHUNK_WIDTH_BLOCKS  # Same width as a streamed chunk
+    COLOR_KEY = (255, 0, 255)  # Marks empty tiles in baked chunks
+
+    def __init__(self, tiles):
+        """Create the renderer with no columns added
+
+        Args:
+            tiles: Tile source with get_tiles(col, row, width, height) (ChunkStreamer)
+        """
+        self.tiles = tiles
+        self.chunk_pixels = int(self.CHUNK_TILES * config.BLOCK_SIZE)
+        self.chunks = set()  # (chunk_x, chunk_y) of chunks that hold tiles
+        self.surfaces = {}  # (chunk_x, chunk_y) -> baked surface
+        self.dirty = set()  # Chunks that need (re-)baking before the next blit
+
+    def add_columns(self, first_col, end_col, height):
+        """Add the non-empty chunks of a range of tile columns
+
+        Args:
+            first_col: First column (at a chunk boundary)
+            end_col: One past the last column
+            height: Number of tile rows
+        """
+        size = self.CHUNK_TILES
+        for chunk_x in range(first_col // size, -(-end_col // size)):
+            for chunk_y in range(-(-height // size)):
+                key = (chunk_x, chunk_y)
+                if self._chunk_tiles(key).any():
+                    self.chunks.add(key)
+                    self.dirty.add(key)
+
+    def remove_columns(self, first_col, end_col):
+        """Drop the chunks (and surfaces) of a range of tile columns"""
+        size = self.CHUNK_TILES
+        first_x = first_col // size
+        end_x = -(-end_col // size)
+        for key in [key for key in self.chunks if first_x <= key[0] < end_x]:
+            self.chunks.discard(key)
+            self.surfaces.pop(key, None)
+            self.dirty.discard(key)
+
+    def invalidate_tile(self, col, row):
+        """Mark the chunk containing a tile for re-baking"""
+        key = (col // self.CHUNK_TILES, row // self.CHUNK_TILES)
+        if key in self.chunks:
+            self.dirty.add(key)
+
+    def _chunk_tiles(self, key):
+        """Get the tile codes of a chunk"""
+        size = self.CHUNK_TILES
+        return self.tiles.get_tiles(key[0] * size, key[1] * size, size, size)
+
+    def _bake(self, key):
+        """Draw all tiles of a chunk into its cached surface"""
+        # Block sprites are opaque, so a color-keyed RLE surface is enough and
+        # blits much faster than per-pixel alpha over the mostly empty chunk
+        surface = self.surfaces.get(key)
+        if surface is None:
+            surface = pygame.Surface((self.chunk_pixels, self.chunk_pixels))
+            surface.set_colorkey(self.COLOR_KEY, pygame.RLEACCEL)
+            self.surfaces[key] = surface
+        surface.fill(self.COLOR_KEY)
+
+        # Tiles render relative to the chunk origin
+        tiles = self._chunk_tiles(key)
+        rows, cols = np.nonzero(tiles)
+        for row, col, code in zip(rows.tolist(), cols.tolist(), tiles[rows, cols].tolist()):
+            _TILE_TYPES_BY_CODE[code].render(surface, col * config.BLOCK_SIZE, row * config.BLOCK_SIZE)
+
+        self.dirty.discard(key)
+
+    def render(self, surface, camera_offset):
+        """Blit the chunks overlapping the visible area
+
+        Returns:
+            Number of chunks that were blitted
+        """
+        view_width, view_height = surface.get_size()
+        first_x = int(camera_offset[0] // self.chunk_pixels)
+        last_x = int((camera_offset[0] + view_width - 1) // self.chunk_pixels)
+        first_y = int(camera_offset[1] // self.chunk_pixels)
+        last_y = int((camera_offset[1] + view_height - 1) // self.chunk_pixels)
+
+        drawn = 0
+        for chunk_x in range(first_x, last_x + 1):
+            for chunk_y in range(first_y, last_y + 1):
+                key = (chunk_x, chunk_y)
+                if key not in self.chunks:
+                    continue
+                if key in self.dirty:
+                    self._bake(key)
+
+                # Floor (not truncate) so neighbouring chunks never leave a seam
+                screen_x = math.floor(chunk_x * self.chunk_pixels - camera_offset[0])
+                screen_y = math.floor(chunk_y * self.chunk_pixels - camera_offset[1])
+                surface.blit(self.surfaces[key], (screen_x, screen_y))
+                drawn += 1
+
+        return drawn
+
+    def get_chunk_count(self):
+        """Get the number of non-empty chunks currently held"""
+        return len(self.chunks)
@@ -0,0 +1,169 @@
+"""
+Chunk streaming
+Keeps only the part of a level around the camera live
+"""
+import numpy as np
+from world.chunk_renderer import ChunkRenderer
+import config
+
+
+class ChunkStreamer:
+    """Loads level chunks as the camera approaches and evicts them behind it
+
+    The level is split into chunks of CHUNK_WIDTH_BLOCKS columns. Only the
+    chunks near the view are live: their tiles are copied into a window
+    array, which the collision system reads and the ChunkRenderer bakes.
+    The loaded chunks always form one contiguous range, so the window is a
+    plain array with a column offset and a one-cell empty border, like
+    LevelData.padded_tiles.
+
+    Chunks are loaded within CHUNK_LOAD_MARGIN of the view and evicted once
+    they are further than CHUNK_EVICT_MARGIN away. Tiles destroyed in a chunk
+    are remembered per chunk, so an evicted chunk comes back as it was left.
+
+    The tiles come from a source with get_width(), get_height() and
+    get_tile_rect() (a LevelData), which is never modified.
+    """
+
+    def __init__(self, source, chunk_width=config.CHUNK_WIDTH_BLOCKS):
+        """Create the streamer with no chunks loaded
+
+        Args:
+            source: Tile source (LevelData) the chunks are cut from
+            chunk_width: Chunk width in tiles
+        """
+        self.source = source
+        self.chunk_renderer = ChunkRenderer(self)  # Bakes the loaded tiles
+        self.width = source.get_width()
+        self.height = source.get_height()
+        self.chunk_width = chunk_width
+        self.chunk_pixels = chunk_width * config.BLOCK_SIZE
+        self.chunk_count = -(-self.width // chunk_width)
+
+        self.first_chunk = 0  # Loaded chunks: first_chunk..last_chunk
+        self.last_chunk = -1
+        self.destroyed = {}  # Chunk -> set of destroyed (column, row), kept across eviction
+        self._set_window(np.zeros((self.height + 2, 2), dtype=np.uint8), 0)
+
+    def _set_window(self, padded_tiles, first_col):
+        """Use a (height + 2) x (columns + 2) array as the loaded tiles"""
+        self.padded_tiles = padded_tiles
+        # Flat byte view for single-cell lookups:
+        # cell (column, row) is at (row + 1) * stride + column - first_col + 1
+        self.cells = memoryview(padded_tiles).cast("B")
+        self.stride = padded_tiles.shape[1]
+        self.first_col = first_col
+        self.end_col = first_col + self.stride - 2  # One past the last loaded column
+
+    def update(self, left, right):
+        """Stream chunks for a horizontal span (e.g. the view plus the player)
+
+        Args:
+            left: Left edge of the span in pixels
+            right: Right edge of the span in pixels
+
+        Returns:
+            True if chunks were loaded or evicted
+        """
+        size = self.chunk_pixels
+        last_index = self.chunk_count - 1
+        want_first = min(max(int((left - config.CHUNK_LOAD_MARGIN) // size), 0), last_index)
+        want_last = min(max(int((right + config.CHUNK_LOAD_MARGIN) // size), 0), last_index)
+
+        first, last = want_first, want_last
+        if self.last_chunk >= self.first_chunk:
+            # Keep loaded chunks until they are beyond the evict margin
+            keep_first = int((left - config.CHUNK_EVICT_MARGIN) // size)
+            keep_last = int((right + config.CHUNK_EVICT_MARGIN) // size)
+            if keep_first <= self.first_chunk <= want_first:
+                first = self.first_chunk
+            if want_last <= self.last_chunk <= keep_last:
+                last = self.last_chunk
+
+        if (first, last) == (self.first_chunk, self.last_chunk):
+            return False
+        self._set_loaded_range(first, last)
+        return True
+
+    def _set_loaded_range(self, first, last):
+        """Evict and load chunks so exactly first..last are loaded"""
+        old_first, old_last = self.first_chunk, self.last_chunk
+        for chunk in range(old_first, old_last + 1):
+            if not first <= chunk <= last:
+                self._evict(chunk)
+
+        # New window; chunks that stay loaded keep their tiles
+        old_tiles, old_first_col = self.padded_tiles, self.first_col
+        first_col = first * self.chunk_width
+        end_col = min((last + 1) * self.chunk_width, self.width)
+        self._set_window(np.zeros((self.height + 2, end_col - first_col + 2), dtype=np.uint8), first_col)
+        stay_first = max(first, old_first) * self.chunk_width
+        stay_end = min((min(last, old_last) + 1) * self.chunk_width, self.width)
+        if stay_first < stay_end:
+            self.padded_tiles[:, stay_first - first_col + 1:stay_end - first_col + 1] = \
+                old_tiles[:, stay_first - old_first_col + 1:stay_end - old_first_col + 1]
+
+        self.first_chunk, self.last_chunk = first, last
+        for chunk in range(first, last + 1):
+            if not old_first <= chunk <= old_last:
+                self._load(chunk)
+
+    def _load(self, chunk):
+        """Copy a chunk's tiles into the window and hand them to the renderer"""
+        first_col = chunk * self.chunk_width
+        width = min(self.chunk_width, self.width - first_col)
+        offset = first_col - self.first_col + 1
+        tiles = self.padded_tiles[1:-1, offset:offset + width]  # View into the window
+        tiles[:] = self.source.get_tile_rect(first_col, 0, width, self.height)
+        for col, row in self.destroyed.get(chunk, ()):
+            tiles[row, col - first_col] = 0  # 0 = EMPTY
+        self.chunk_renderer.add_columns(first_col, first_col + width, self.height)
+
+    def _evict(self, chunk):
+        """Drop a chunk from the renderer (its destroyed tiles stay remembered)"""
+        first_col = chunk * self.chunk_width
+        self.chunk_renderer.remove_columns(first_col, min(first_col + self.chunk_width, self.width))
+
+    def destroy_tile(self, col, row):
+        """Destroy the tile in a loaded grid cell
+
+        Returns:
+            True if the cell held a tile
+        """
+        if not self.get_tile_code(col, row):
+            return False
+        self.cells[(row + 1) * self.stride + col - self.first_col + 1] = 0  # 0 = EMPTY
+        self.destroyed.setdefault(col // self.chunk_width, set()).add((col, row))
+        self.chunk_renderer.invalidate_tile(col, row)
+        return True
+
+    def reset(self):
+        """Forget all destroyed tiles and reload the loaded chunks that had some"""
+        changed = [chunk for chunk in self.destroyed if self.first_chunk <= chunk <= self.last_chunk]
+        self.destroyed.clear()
+        for chunk in changed:
+            self._evict(chunk)
+            self._load(chunk)
+
+    def get_tile_code(self, col, row):
+        """Get the tile code of a cell (0 = EMPTY outside the loaded chunks)"""
+        if self.first_col <= col < self.end_col and 0 <= row < self.height:
+            return self.cells[(row + 1) * self.stride + col - self.first_col + 1]
+        return 0
+
+    def get_tiles(self, col, row, width, height):
+        """Get a view of the loaded tile codes in a rectangle (clipped to the loaded chunks)
+
+        Args:
+            col: Left column
+            row: Top row (counted from the top)
+            width: Number of columns
+            height: Number of rows
+        """
+        tiles = self.padded_tiles[1:-1, 1:-1]
+        first = min(max(col - self.first_col, 0), tiles.shape[1])
+        end = min(max(col + width - self.first_col, 0), tiles.shape[1])
+        return tiles[max(row, 0):max(row + height, 0), first:end]
+
+    def get_loaded_chunk_count(self):
+        return self.last_chunk - self.first_chunk + 1
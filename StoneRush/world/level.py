@@ -2,39 +2,74 @@
 Level management
 Ported from Level.java
 """
+import math
+import os
 import pygame
-from entities.block import Block
-from entities.enemy import Enemy
+import numpy as np
+from entities.block import Block, TILE_TYPES
+from entities.enemy_manager import EnemyManager
 from entities.player import Player
 from enums import BlockType
-from world.level_data import LevelData
+from world.level_data import LevelData, BLOCK_TYPES
+from world.chunk_streamer import ChunkStreamer
+from world.broad_phase import BroadPhase
 import config
 
 
 class Level:
     """Manages level layout, entities, and rendering"""
 
+    # Loaded or generated level data per level number. Shared and never
+    # modified; the chunk streamer keeps destroyed tiles separately.
+    _level_data_cache = {}
+
+    # Below this many living enemies, testing each one beats the broad phase
+    BROAD_PHASE_MIN_ENEMIES = 64
+
     def __init__(self, level_number=1):
-        self.blocks = []
-        self.enemies = []
+        self.streamer = None  # Loads the chunks around the camera (tiles and blocks)
+        self.enemies = []  # Living enemies (views into enemy_manager)
+        self.enemy_manager = None
+        self.enemy_broad_phase = BroadPhase()  # Living enemies sorted by x
         self.player = None
+        self.player_spawn_position = None
         self.goal_bounds = None
+        self.chunk_renderer = None
         self.level_data = None
         self.level_number = level_number
 
         # Create and build level based on level number
-        self.level_data = self._create_level_data(level_number)
+        self.level_data = self.get_level_data(level_number)
         self._build_level()
 
-    def _create_level_data(self, level_number):
+    @classmethod
+    def get_level_data(cls, level_number):
+        """Get the (memoized) level data for a level number
+
+        Loaded from the level file if there is one, generated otherwise.
+        """
+        data = cls._level_data_cache.get(level_number)
+        if data is None:
+            path = cls.get_level_path(level_number)
+            if os.path.exists(path):
+                data = LevelData.load(path)
+            else:
+                data = cls._create_level_data(level_number)
+            cls._level_data_cache[level_number] = data
+        return data
+
+    @staticmethod
+    def get_level_path(level_number):
+        """Get the path of the level file for a level number"""
+        return os.path.join(config.LEVELS_DIR, f"level_{level_number:02d}.srl")
+
+    @staticmethod
+    def _create_level_data(level_number):
         """Create level data based on level number (1-10)"""
         data = LevelData(config.LEVEL_WIDTH_BLOCKS, config.LEVEL_HEIGHT_BLOCKS)
 
         # Create ground (bottom 3 rows)
-        for x in range(data.get_width()):
-            data.set_block(x, 0, BlockType.GROUND)
-            data.set_block(x, 1, BlockType.GROUND)
-            data.set_block(x, 2, BlockType.GROUND)
+        data.fill_blocks(0, 0, data.get_width(), 3, BlockType.GROUND)
 
         # Level difficulty increases with level number
         num_platforms = 4 + level_number  # More platforms each level
@@ -47,10 +82,7 @@ class Level:
         for i in range(num_gaps):
             gap_x = 15 + i * gap_spacing
             gap_width = 3 + (level_number // 2)  # Wider gaps at higher levels
-            for x in range(gap_x, min(gap_x + gap_width, data.get_width())):
-                data.set_block(x, 0, BlockType.EMPTY)
-                data.set_block(x, 1, BlockType.EMPTY)
-                data.set_block(x, 2, BlockType.EMPTY)
+            data.fill_blocks(gap_x, 0, gap_width, 3, BlockType.EMPTY)
 
         # Create platforms at varying heights
         platform_x = 10
@@ -59,9 +91,7 @@ class Level:
             platform_width = 8 - (level_number // 3)  # Shorter platforms at higher levels
             platform_width = max(platform_width, 4)  # Minimum width of 4
 
-            for x in range(platform_x, platform_x + platform_width):
-                if x < data.get_width():
-                    data.set_block(x, platform_height, BlockType.GROUND)
+            data.fill_blocks(platform_x, platform_height, platform_width, 1, BlockType.GROUND)
 
             platform_x += 12 + (level_number // 2)  # Platforms further apart at higher levels
 
@@ -71,9 +101,7 @@ class Level:
             cracked_height = 3 + (i % 3)
             num_vertical = 1 + (level_number // 4)  # Stack more blocks at higher levels
 
-            for y in range(cracked_height, cracked_height + num_vertical):
-                if cracked_x < data.get_width():
-                    data.set_block(cracked_x, y, BlockType.CRACKED)
+            data.fill_blocks(cracked_x, cracked_height, 1, num_vertical, BlockType.CRACKED)
 
             cracked_x += 15 + (i * 5)
 
@@ -91,36 +119,24 @@ class Level:
 
         return data
 
-    def _create_level_1_data(self):
+    @staticmethod
+    def _create_level_1_data():
         """Create Level 1 data (identical to Java version)"""
         data = LevelData(config.LEVEL_WIDTH_BLOCKS, config.LEVEL_HEIGHT_BLOCKS)
 
         # Create ground (bottom 3 rows)
-        for x in range(data.get_width()):
-            data.set_block(x, 0, BlockType.GROUND)
-            data.set_block(x, 1, BlockType.GROUND)
-            data.set_block(x, 2, BlockType.GROUND)
+        data.fill_blocks(0, 0, data.get_width(), 3, BlockType.GROUND)
 
         # Add platforms
-        for x in range(10, 20):
-            data.set_block(x, 5, BlockType.GROUND)
-
-        for x in range(25, 35):
-            data.set_block(x, 8, BlockType.GROUND)
-
-        for x in range(40, 50):
-            data.set_block(x, 6, BlockType.GROUND)
-
-        for x in range(70, 80):
-            data.set_block(x, 7, BlockType.GROUND)
+        data.fill_blocks(10, 5, 10, 1, BlockType.GROUND)
+        data.fill_blocks(25, 8, 10, 1, BlockType.GROUND)
+        data.fill_blocks(40, 6, 10, 1, BlockType.GROUND)
+        data.fill_blocks(70, 7, 10, 1, BlockType.GROUND)
 
         # Add cracked blocks (obstacles to ram through)
-        data.set_block(20, 3, BlockType.CRACKED)
-        data.set_block(20, 4, BlockType.CRACKED)
+        data.fill_blocks(20, 3, 1, 2, BlockType.CRACKED)
         data.set_block(45, 3, BlockType.CRACKED)
-        data.set_block(60, 3, BlockType.CRACKED)
-        data.set_block(60, 4, BlockType.CRACKED)
-        data.set_block(60, 5, BlockType.CRACKED)
+        data.fill_blocks(60, 3, 1, 3, BlockType.CRACKED)
 
         # Set spawn points
         data.set_player_spawn(64, 96)  # 2 blocks up from ground (2 * 32)
@@ -137,37 +153,48 @@ class Level:
 
     def _build_level(self):
         """Build level from data"""
-        # Create blocks from data
-        for x in range(self.level_data.get_width()):
-            for y in range(self.level_data.get_height()):
-                block_type = self.level_data.get_block(x, y)
-                if block_type != BlockType.EMPTY:
-                    # Flip y-coordinate: LibGDX has y=0 at bottom, Pygame has y=0 at top
-                    pixel_y = (config.LEVEL_HEIGHT_BLOCKS - 1 - y) * config.BLOCK_SIZE
-                    self.blocks.append(
-                        Block(x * config.BLOCK_SIZE, pixel_y, block_type)
-                    )
+        # Terrain stays tile codes (no object per block); only the chunks near
+        # the camera are loaded, and their tiles are baked into cached surfaces
+        self.streamer = ChunkStreamer(self.level_data)
+        self.chunk_renderer = self.streamer.chunk_renderer
 
         # Create player (flip y-coordinate from LibGDX to Pygame)
         player_spawn = self.level_data.get_player_spawn()
         player_y = config.WINDOW_HEIGHT - player_spawn.y - config.PLAYER_SIZE
+        self.player_spawn_position = (player_spawn.x, player_y)
         self.player = Player(player_spawn.x, player_y)
 
+        # Load the chunks around the start of the level (camera at the origin)
+        self.stream_chunks(pygame.Vector2(0, 0))
+
         # Create enemies (flip y-coordinate from LibGDX to Pygame)
-        for spawn in self.level_data.get_enemy_spawns():
-            enemy_y = config.WINDOW_HEIGHT - spawn.y - config.ENEMY_SIZE
-            self.enemies.append(Enemy(spawn.x, enemy_y))
+        self.enemy_manager = EnemyManager([
+            (spawn.x, config.WINDOW_HEIGHT - spawn.y - config.ENEMY_SIZE)
+            for spawn in self.level_data.get_enemy_spawns()
+        ])
+        self.enemies = list(self.enemy_manager.enemies)
+        self.enemy_broad_phase.set_indices(self.enemy_manager.get_living_indices())
 
         # Create goal (flip y-coordinate from LibGDX to Pygame)
         goal_pos = self.level_data.get_goal_position()
         goal_y = config.WINDOW_HEIGHT - goal_pos.y - 96  # Goal height is 96
         self.goal_bounds = pygame.Rect(goal_pos.x, goal_y, 64, 96)
 
-    def render(self, surface, camera_offset):
-        """Render level blocks and goal"""
-        # Render blocks
-        for block in self.blocks:
-            block.render(surface, camera_offset)
+    def render(self, surface, camera_offset, culler=None):
+        """Render level blocks and goal
+
+        Args:
+            surface: Pygame surface to render to
+            camera_offset: Tuple (x, y) for camera offset
+            culler: Optional ViewCuller that skips and counts off-screen objects
+        """
+        # Render blocks (pre-baked chunks, only the visible ones)
+        drawn = self.chunk_renderer.render(surface, camera_offset)
+        if culler:
+            culler.record(drawn, self.chunk_renderer.get_chunk_count() - drawn)
+
+        if culler and not culler.is_visible(self.goal_bounds):
+            return
 
         # Render goal (green rectangle with flag pole)
         screen_x = self.goal_bounds.x - camera_offset[0]
@@ -180,24 +207,161 @@ class Level:
         pygame.draw.rect(surface, config.COLOR_DARK_GRAY,
                         (screen_x + 10, screen_y, 4, self.goal_bounds.height))
 
+    def stream_chunks(self, view_position):
+        """Load the chunks around the view and the player, evict far ones
+
+        Call at the start of every step, before anything reads the tiles.
+
+        Args:
+            view_position: Top-left corner of the view (Camera.position)
+        """
+        bounds = self.player.get_bounds()
+        self.streamer.update(min(view_position.x, bounds.left),
+                             max(view_position.x + config.WINDOW_WIDTH, bounds.right))
+
     def get_blocks_in_range(self, area):
         """Get blocks that overlap with the given area
 
+        Only the grid cells under the area are visited, so the cost depends on
+        the size of the area and not on the number of blocks in the level.
+        The Block objects are views created for this call.
+
         Args:
             area: pygame.Rect representing the search area
 
         Returns:
             List of blocks that are solid and overlap with the area
+            (only blocks of loaded chunks)
         """
+        size = config.BLOCK_SIZE
+        return [Block(col * size, row * size, self.get_tile(col, row))
+                for col, row in self.get_solid_cells(area.x, area.y, area.width, area.height)]
+
+    def get_solid_cells(self, left, top, width, height):
+        """Get the grid cells with a solid block under an integer area
+
+        Args:
+            left: Left edge of the area in pixels
+            top: Top edge of the area in pixels
+            width: Width of the area in pixels
+            height: Height of the area in pixels
+
+        Returns:
+            List of (column, row), column by column and bottom to top (the
+            order collision resolution has always seen the blocks in)
+        """
+        if width <= 0 or height <= 0:
+            return []
+
+        size = int(config.BLOCK_SIZE)
+        streamer = self.streamer
+        # Cells outside the loaded chunks are empty, so clip to them
+        first_col = max(left // size, streamer.first_col)
+        last_col = min((left + width - 1) // size, streamer.end_col - 1)
+        first_row = max(top // size, 0)
+        last_row = min((top + height - 1) // size, streamer.height - 1)
+
+        # Walk the columns in the flat byte view of the loaded tiles
         result = []
-        for block in self.blocks:
-            if block.is_solid() and area.colliderect(block.get_bounds()):
-                result.append(block)
+        cells = streamer.cells
+        stride = streamer.stride
+        for col in range(first_col, last_col + 1):
+            offset = stride + col - streamer.first_col + 1
+            for row in range(last_row, first_row - 1, -1):
+                if cells[row * stride + offset]:  # 0 = EMPTY
+                    result.append((col, row))
         return result
 
+    def get_tile(self, col, row):
+        """Get the block type of a grid cell
+
+        Args:
+            col: Column (x // BLOCK_SIZE)
+            row: Row counted from the top (y // BLOCK_SIZE)
+
+        Returns:
+            BlockType of the cell (EMPTY outside the loaded chunks or once destroyed)
+        """
+        return BLOCK_TYPES[self.streamer.get_tile_code(col, row)]
+
+    def get_tile_type(self, col, row):
+        """Get the shared TileType (sprite and behaviour) of a grid cell"""
+        return TILE_TYPES[self.get_tile(col, row)]
+
+    def are_solid_tiles(self, cols, rows):
+        """Check which grid cells hold a solid block, for NumPy arrays of columns and rows
+
+        Columns and rows may be whole-numbered float arrays; they broadcast
+        against each other.
+        """
+        grid = self.streamer.padded_tiles
+        height, width = grid.shape
+        # Cells outside the loaded chunks land on the empty border
+        rows = np.minimum(np.maximum(rows + 1, 0), height - 1)
+        cols = np.minimum(np.maximum(cols - (self.streamer.first_col - 1), 0), width - 1)
+        return grid.ravel()[(rows * width + cols).astype(np.intp)] != 0  # 0 = EMPTY
+
+    def destroy_tile(self, col, row):
+        """Destroy the block in a grid cell and re-bake its chunk
+
+        Args:
+            col: Column (x // BLOCK_SIZE)
+            row: Row counted from the top (y // BLOCK_SIZE)
+        """
+        self.streamer.destroy_tile(col, row)
+
+    def reset(self):
+        """Restore blocks, enemies and the player to their spawn state in place
+
+        Used on respawn instead of building a new level.
+        """
+        # Bring back destroyed blocks (loaded chunks are rebuilt, evicted
+        # ones simply come back intact)
+        self.streamer.reset()
+
+        # Revive enemies at their spawn points
+        self.enemy_manager.reset()
+        self.enemies = list(self.enemy_manager.enemies)
+        self.enemy_broad_phase.set_indices(self.enemy_manager.get_living_indices())
+
+        self.player.reset(*self.player_spawn_position)
+
+        # Back to the start of the level (the camera jumps to the origin too)
+        self.stream_chunks(pygame.Vector2(0, 0))
+
+    def get_enemies_in_range(self, area):
+        """Get living enemies that overlap with the given area
+
+        Args:
+            area: pygame.Rect representing the search area
+
+        Returns:
+            List of enemies whose bounds overlap the area
+        """
+        manager = self.enemy_manager
+        if len(self.enemies) < self.BROAD_PHASE_MIN_ENEMIES:
+            # Same test as the broad phase, one enemy at a time
+            xs = manager.x.tolist()
+            ys = manager.y.tolist()
+            hits = []
+            for enemy in self.enemies:
+                x = xs[enemy.index]
+                y = ys[enemy.index]
+                left = math.trunc(x + math.copysign(0.5, x))  # Rounded like pygame.Rect
+                top = math.trunc(y + math.copysign(0.5, y))
+                if (left < area.right and left + manager.WIDTH > area.left
+                        and top < area.bottom and top + manager.HEIGHT > area.top):
+                    hits.append(enemy)
+            return hits
+
+        left, top = manager.get_bounds_arrays()
+        indices = self.enemy_broad_phase.query(area, left, top, manager.WIDTH, manager.HEIGHT)
+        return [manager.enemies[i] for i in indices]
+
     def remove_dead_enemies(self):
-        """Remove dead enemies from the list"""
+        """Remove dead enemies from the list (call only after an enemy died)"""
         self.enemies = [enemy for enemy in self.enemies if not enemy.is_dead]
+        self.enemy_broad_phase.set_indices(self.enemy_manager.get_living_indices())
 
     def get_player(self):
         return self.player
@@ -205,8 +369,22 @@ class Level:
     def get_enemies(self):
         return self.enemies
 
+    def get_enemy_manager(self):
+        return self.enemy_manager
+
     def get_blocks(self):
-        return self.blocks
+        """Get Block views of all solid tiles in the loaded chunks"""
+        streamer = self.streamer
+        return self.get_blocks_in_range(pygame.Rect(
+            streamer.first_col * config.BLOCK_SIZE, 0,
+            (streamer.end_col - streamer.first_col) * config.BLOCK_SIZE,
+            streamer.height * config.BLOCK_SIZE))
+
+    def get_pixel_width(self):
+        return self.level_data.get_width() * config.BLOCK_SIZE
+
+    def get_pixel_height(self):
+        return self.level_data.get_height() * config.BLOCK_SIZE
 
     def get_goal_bounds(self):
         return self.goal_bounds
@@ -2,34 +2,177 @@
 Level data structure
 Ported from LevelData.java
 """
+import json
+import os
+import struct
 import pygame
+import numpy as np
 from enums import BlockType
 import config
 
 
+# Tile codes stored in the grid (one byte per cell)
+BLOCK_TYPES = (BlockType.EMPTY, BlockType.GROUND, BlockType.CRACKED)
+BLOCK_CODES = {block_type: code for code, block_type in enumerate(BLOCK_TYPES)}
+
+# Binary level file (.srl), little endian:
+#   header   magic, version, width, height, player spawn x/y, goal x/y, enemy count
+#   spawns   enemy count x (x, y) doubles
+#   tiles    width * height tile codes, row-major, rows counted from the top
+# Optional metadata (name, author, ...) lives in a JSON sidecar next to it.
+LEVEL_FILE_MAGIC = b"SRLV"
+LEVEL_FILE_VERSION = 1
+_HEADER = struct.Struct("<4sHII4dI")
+_SPAWN = struct.Struct("<2d")
+
+
 class LevelData:
-    """Data structure for level layout and spawn points"""
+    """Data structure for level layout and spawn points
+
+    The tile layer is a single NumPy uint8 array (one byte per cell, see
+    BLOCK_CODES), row-major with rows counted from the top like the screen.
+    get_block() / set_block() keep the LibGDX convention (y=0 at the bottom).
+    The array has a one-cell EMPTY border, so batched lookups can clamp
+    cells outside the level onto it; `tiles` is the view without the border.
+    Other systems read the arrays directly (no copies).
+    """
 
     def __init__(self, width, height):
         self.width = width
         self.height = height
         # Initialize grid with EMPTY blocks
-        self.blocks = [[BlockType.EMPTY for _ in range(height)] for _ in range(width)]
+        self._set_padded_tiles(np.zeros((height + 2, width + 2), dtype=np.uint8))
         self.player_spawn = pygame.Vector2(0, 0)
         self.enemy_spawns = []
         self.goal_position = pygame.Vector2(0, 0)
+        self.metadata = {}  # Free-form level info from the JSON sidecar
+
+    @classmethod
+    def load(cls, path):
+        """Load level data from a binary level file
+
+        The file is read with a single bulk read and the tile layer is copied
+        straight into the grid, so loading stays fast for large levels.
+
+        Args:
+            path: Path of the .srl file (a .json sidecar next to it is optional)
+
+        Returns:
+            LevelData
+
+        Raises:
+            ValueError: If the file is not a valid level file
+        """
+        with open(path, "rb") as f:
+            buffer = f.read()
+
+        if len(buffer) < _HEADER.size:
+            raise ValueError(f"{path}: too short for a level file")
+        (magic, version, width, height, spawn_x, spawn_y,
+         goal_x, goal_y, enemy_count) = _HEADER.unpack_from(buffer)
+        if magic != LEVEL_FILE_MAGIC:
+            raise ValueError(f"{path}: not a level file")
+        if version != LEVEL_FILE_VERSION:
+            raise ValueError(f"{path}: unsupported level file version {version}")
+        tiles_offset = _HEADER.size + enemy_count * _SPAWN.size
+        if len(buffer) != tiles_offset + width * height:
+            raise ValueError(f"{path}: size does not match {width}x{height} tiles")
+
+        data = cls(width, height)
+        data.set_player_spawn(spawn_x, spawn_y)
+        data.set_goal_position(goal_x, goal_y)
+        for x, y in _SPAWN.iter_unpack(buffer[_HEADER.size:tiles_offset]):
+            data.add_enemy_spawn(x, y)
+
+        tiles = np.frombuffer(buffer, dtype=np.uint8, offset=tiles_offset).reshape(height, width)
+        if tiles.size and tiles.max() >= len(BLOCK_TYPES):
+            raise ValueError(f"{path}: unknown tile code {tiles.max()}")
+        data.tiles[:] = tiles
+
+        sidecar = os.path.splitext(path)[0] + ".json"
+        if os.path.exists(sidecar):
+            with open(sidecar, encoding="utf-8") as f:
+                data.metadata = json.load(f)
+        return data
+
+    def save(self, path):
+        """Write the level data to a binary level file (see load)
+
+        The metadata, if any, is written to a JSON sidecar with the same name.
+        """
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(LEVEL_FILE_MAGIC, LEVEL_FILE_VERSION, self.width, self.height,
+                                 self.player_spawn.x, self.player_spawn.y,
+                                 self.goal_position.x, self.goal_position.y,
+                                 len(self.enemy_spawns)))
+            for spawn in self.enemy_spawns:
+                f.write(_SPAWN.pack(spawn.x, spawn.y))
+            f.write(np.ascontiguousarray(self.tiles).tobytes())
+
+        if self.metadata:
+            with open(os.path.splitext(path)[0] + ".json", "w", encoding="utf-8") as f:
+                json.dump(self.metadata, f, indent=2)
+                f.write("\n")
+
+    def _set_padded_tiles(self, padded_tiles):
+        """Use a (height + 2) x (width + 2) array as the tile layer"""
+        self.padded_tiles = padded_tiles
+        self.tiles = padded_tiles[1:-1, 1:-1]  # [row, column] without the border
+        # Flat byte view for single-cell lookups (faster than NumPy indexing):
+        # cell (column, row) is at (row + 1) * stride + column + 1
+        self.cells = memoryview(padded_tiles).cast("B")
+        self.stride = self.width + 2
 
     def set_block(self, x, y, block_type):
         """Set block type at grid position"""
         if 0 <= x < self.width and 0 <= y < self.height:
-            self.blocks[x][y] = block_type
+            self.cells[(self.height - y) * self.stride + x + 1] = BLOCK_CODES[block_type]
 
     def get_block(self, x, y):
         """Get block type at grid position"""
         if 0 <= x < self.width and 0 <= y < self.height:
-            return self.blocks[x][y]
+            return BLOCK_TYPES[self.cells[(self.height - y) * self.stride + x + 1]]
         return BlockType.EMPTY
 
+    def fill_blocks(self, x, y, width, height, block_type):
+        """Set block type for a rectangle of grid positions (clipped to the level)
+
+        Args:
+            x: Left column
+            y: Bottom row (y=0 at the bottom, like set_block)
+            width: Number of columns
+            height: Number of rows
+            block_type: BlockType to fill in
+        """
+        left = max(x, 0)
+        right = min(x + width, self.width)
+        bottom = max(y, 0)
+        top = min(y + height, self.height)
+        if left < right and bottom < top:
+            self.tiles[self.height - top:self.height - bottom, left:right] = BLOCK_CODES[block_type]
+
+    def get_tile_row(self, row):
+        """Get a view of one row of tile codes (row counted from the top)"""
+        return self.tiles[row]
+
+    def get_tile_column(self, col):
+        """Get a view of one column of tile codes (top to bottom)"""
+        return self.tiles[:, col]
+
+    def get_tile_rect(self, col, row, width, height):
+        """Get a view of the tile codes in a rectangle (clipped to the level)
+
+        Args:
+            col: Left column
+            row: Top row (counted from the top)
+            width: Number of columns
+            height: Number of rows
+
+        Returns:
+            uint8 array [row, column] sharing memory with the level data
+        """
+        return self.tiles[max(row, 0):max(row + height, 0), max(col, 0):max(col + width, 0)]
+
     def set_player_spawn(self, x, y):
         """Set player spawn position (in pixels)"""
         self.player_spawn = pygame.Vector2(x, y)
@@ -48,6 +191,9 @@ class LevelData:
     def get_height(self):
         return self.height
 
+    def get_tiles(self):
+        return self.tiles
+
     def get_player_spawn(self):
         return self.player_spawn
 
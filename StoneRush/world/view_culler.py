@@ -0,0 +1,42 @@
+"""
+View culling
+Skips draw calls for objects outside the camera view
+"""
+import math
+import pygame
+
+
+class ViewCuller:
+    """Tests objects against the visible area and counts what was skipped"""
+
+    def __init__(self):
+        self.view = pygame.Rect(0, 0, 0, 0)
+        self.drawn_count = 0
+        self.culled_count = 0
+
+    def begin_frame(self, camera_offset, width, height):
+        """Set the visible area for this frame and reset the counters
+
+        Args:
+            camera_offset: Tuple (x, y) from Camera.get_offset()
+            width: Width of the visible area in pixels
+            height: Height of the visible area in pixels
+        """
+        # Grow by one pixel so objects straddling a fractional edge still draw
+        self.view.update(math.floor(camera_offset[0]), math.floor(camera_offset[1]),
+                         width + 1, height + 1)
+        self.drawn_count = 0
+        self.culled_count = 0
+
+    def is_visible(self, rect):
+        """Returns True if the rect (in world pixels) overlaps the view"""
+        if self.view.colliderect(rect):
+            self.drawn_count += 1
+            return True
+        self.culled_count += 1
+        return False
+
+    def record(self, drawn, culled):
+        """Add counts for objects culled in bulk (e.g. terrain chunks)"""
+        self.drawn_count += drawn
+        self.culled_count += culled